@@ -0,0 +1,83 @@
+import pytest
+
+from users.duplicates import (BLOCK_SCORE, blocking_keys, find_duplicates,
+                              match_score, reindex)
+from users.models import Participant
+
+SMIRNOV = {
+    'full_name': 'Смирнов Алексей Петрович',
+    'email': 'a.smirnov@mail.ru',
+    'phone': '+7 (912) 345-67-89',
+    'organisation': 'ФГБУН ИПЭ УрО РАН',
+}
+
+
+def test_blocking_keys_normalise_contacts():
+    keys = blocking_keys({
+        'full_name': 'СМИРНОВ  Алексей',
+        'email': ' A.Smirnov+conf@Mail.RU ',
+        'phone': '8 912 345 67 89',
+        'organisation': 'ООО ИПЭ',
+    })
+    assert {'e:a.smirnov@mail.ru', 'p:9123456789'} <= keys
+    # Организационно-правовые формы не различают организации.
+    organisation = {key for key in keys if key.startswith('o:')}
+    assert organisation
+    assert organisation <= blocking_keys(SMIRNOV)
+
+
+def test_blocking_keys_match_phonetic_spelling():
+    first = blocking_keys({'full_name': 'Сергеев Пётр'})
+    second = blocking_keys({'full_name': 'Сергеефф Петр'})
+    assert first & second
+
+
+def test_blocking_keys_ignore_short_phone_and_empty_values():
+    assert blocking_keys({'phone': '12-34'}) == set()
+    assert blocking_keys({}) == set()
+
+
+def test_match_score_identical_participant():
+    assert match_score(SMIRNOV, dict(SMIRNOV)) == 1.0
+
+
+def test_match_score_blocks_initials_with_same_contacts():
+    other = dict(SMIRNOV, full_name='Смирнов А. П.',
+                 email='A.Smirnov@mail.ru')
+    assert match_score(SMIRNOV, other) >= BLOCK_SCORE
+
+
+def test_match_score_blocks_same_phone_and_surname():
+    other = {'full_name': 'Смирнов А.', 'phone': '89123456789'}
+    assert match_score(SMIRNOV, other) >= BLOCK_SCORE
+
+
+def test_match_score_allows_namesake_with_other_contacts():
+    other = {'full_name': 'Смирнов Алексей Петрович',
+             'email': 'smirnov@yandex.ru', 'phone': '89001112233'}
+    assert match_score(SMIRNOV, other) < BLOCK_SCORE
+
+
+def test_match_score_allows_shared_contacts_with_other_surname():
+    other = dict(SMIRNOV, full_name='Петрова Мария Сергеевна')
+    assert match_score(SMIRNOV, other) < BLOCK_SCORE
+
+
+def test_match_score_allows_colleague_with_shared_phone():
+    other = dict(SMIRNOV, full_name='Смирнова Мария Ивановна',
+                 email='m.smirnova@mail.ru')
+    assert match_score(SMIRNOV, other) < BLOCK_SCORE
+
+
+@pytest.mark.django_db
+def test_find_duplicates_keeps_exact_contact_in_large_block():
+    Participant.objects.bulk_create(
+        Participant(username=f'smirnov{i}', full_name=f'Смирнов Андрей {i}',
+                    email=f'smirnov{i}@example.com')
+        for i in range(60))
+    target = Participant.objects.create(username='smirnov', **SMIRNOV)
+    reindex(Participant.objects.all())
+    score, match = find_duplicates(
+        dict(SMIRNOV, full_name='Смирнов А.'))[0]
+    assert match['pk'] == target.pk
+    assert score >= BLOCK_SCORE
@@ -0,0 +1,118 @@
+import pytest
+from django.utils.timezone import localdate
+
+from blog.constants import SPAM_BUCKETS, SPAM_MAX_TOKENS, SPAM_MIN_DOCUMENTS
+from blog.models import Category, Comment, Post, SpamToken
+from blog.spam import TOTALS, SpamFilter, token_buckets
+from users.models import Participant
+
+SPAM = 'Дешевые кредиты без проверки http://cheap-loans.example/offer'
+HAM = 'Спасибо за доклад, интересные результаты по реакторам'
+
+
+def test_token_buckets_are_case_insensitive_and_unique():
+    assert token_buckets('Привет привет ПРИВЕТ') == token_buckets('привет')
+    assert len(token_buckets('привет привет мир')) == 2
+
+
+def test_token_buckets_skip_totals_bucket():
+    buckets = token_buckets(' '.join(f'слово{i}' for i in range(200)))
+    assert buckets
+    assert all(TOTALS < bucket < SPAM_BUCKETS for bucket in buckets)
+
+
+def test_token_buckets_keep_link_host_as_one_token():
+    host = token_buckets('http://spam.example')
+    assert len(host) == 1
+    assert host < token_buckets('http://spam.example/offer')
+
+
+def test_token_buckets_limit_tokens():
+    text = ' '.join(f'слово{i}' for i in range(SPAM_MAX_TOKENS * 2))
+    assert len(token_buckets(text)) <= SPAM_MAX_TOKENS
+
+
+@pytest.mark.django_db
+def test_probability_is_neutral_until_trained():
+    spam_filter = SpamFilter()
+    spam_filter.learn([SPAM], is_spam=True)
+    assert spam_filter.probability(SPAM) == 0.0
+    assert not spam_filter.is_spam(SPAM)
+
+
+@pytest.mark.django_db
+def test_learn_separates_spam_from_ham():
+    spam_filter = SpamFilter()
+    spam_filter.learn([f'{SPAM} {i}' for i in range(SPAM_MIN_DOCUMENTS)],
+                      is_spam=True)
+    spam_filter.learn([f'{HAM} {i}' for i in range(SPAM_MIN_DOCUMENTS)],
+                      is_spam=False)
+    assert spam_filter.is_spam('Кредиты без проверки '
+                               'http://cheap-loans.example')
+    assert not spam_filter.is_spam('Интересные результаты, спасибо')
+    assert 0 < spam_filter.probability(HAM) < 0.5 < spam_filter.probability(
+        SPAM) < 1
+
+
+@pytest.mark.django_db
+def test_learning_in_another_process_is_picked_up():
+    worker, trainer = SpamFilter(), SpamFilter()
+    assert worker.probability(SPAM) == 0.0
+    trainer.learn([f'{SPAM} {i}' for i in range(SPAM_MIN_DOCUMENTS)],
+                  is_spam=True)
+    trainer.learn([f'{HAM} {i}' for i in range(SPAM_MIN_DOCUMENTS)],
+                  is_spam=False)
+    assert worker.is_spam(SPAM)
+    trainer.reset()
+    assert worker.probability(SPAM) == 0.0
+
+
+def counts():
+    """Ненулевые счетчики корзин: (спам, обычные)."""
+    tokens = SpamToken.objects.filter(bucket__lt=SPAM_BUCKETS)
+    return tuple(
+        dict(tokens.filter(**{f'{field}__gt': 0}).values_list(
+            'bucket', field))
+        for field in ('spam', 'ham'))
+
+
+@pytest.mark.django_db
+def test_unlearn_subtracts_learned_counts():
+    spam_filter = SpamFilter()
+    spam_filter.learn([HAM], is_spam=False)
+    before = counts()
+    spam_filter.learn([SPAM, HAM], is_spam=True)
+    spam_filter.unlearn([SPAM, HAM], is_spam=True)
+    assert counts() == before
+
+
+@pytest.mark.django_db
+def test_unlearn_does_not_go_below_zero():
+    spam_filter = SpamFilter()
+    spam_filter.learn([HAM], is_spam=False)
+    spam_filter.unlearn([SPAM, HAM], is_spam=False)
+    assert counts() == ({}, {})
+
+
+@pytest.mark.django_db
+def test_train_moves_comment_between_classes():
+    author = Participant.objects.create(username='author')
+    post = Post.objects.create(
+        title='Пост', text='Текст', pub_date=localdate(), author=author,
+        category=Category.objects.create(title='Новости', slug='news'))
+    comment = Comment.objects.create(text=SPAM, post=post, author=author)
+    comments = Comment.objects.filter(pk=comment.pk)
+    spam_filter = SpamFilter()
+
+    spam_filter.train(comments, is_spam=True)
+    spam_filter.train(comments, is_spam=True)
+    spam, ham = counts()
+    assert spam[TOTALS] == 1
+    assert TOTALS not in ham
+
+    spam_filter.train(comments, is_spam=False)
+    spam, ham = counts()
+    assert spam == {}
+    assert ham[TOTALS] == 1
+    comment.refresh_from_db()
+    assert comment.spam_label is False
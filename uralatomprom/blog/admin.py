@@ -1,12 +1,88 @@
-from django.contrib import admin
+from django.contrib import admin, messages
+from django.contrib.admin.helpers import ACTION_CHECKBOX_NAME, ActionForm
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.contrib.auth.models import Group
+from django import forms
+from django.db.models import Count
+from django.template.response import TemplateResponse
 from django.utils.safestring import mark_safe
 
-from .models import Category, Post, User
+from . import moderation
+from .models import Category, Comment, Post, User
+from .spam import spam_filter
 
 admin.site.empty_value_display = 'Не задано'
 
+SAMPLE_SIZE = 20
+
+
+class ModerationActionForm(ActionForm):
+    category = forms.ModelChoiceField(
+        Category.objects, required=False, label='Категория')
+
+
+@admin.action(description='Опубликовать выбранные')
+def publish_selected(modeladmin, request, queryset):
+    count = moderation.publish(queryset)
+    modeladmin.message_user(request, f'Опубликовано: {count}')
+
+
+@admin.action(description='Снять с публикации выбранные')
+def unpublish_selected(modeladmin, request, queryset):
+    count = moderation.unpublish(queryset)
+    modeladmin.message_user(request, f'Снято с публикации: {count}')
+
+
+@admin.action(description='Удалить выбранные пакетами',
+              permissions=('delete',))
+def delete_in_batches(modeladmin, request, queryset):
+    if request.POST.get('post'):
+        count = moderation.delete(queryset)
+        modeladmin.message_user(request, f'Удалено: {count}')
+        return None
+    opts = modeladmin.model._meta
+    return TemplateResponse(
+        request, 'admin/blog/delete_in_batches_confirmation.html', {
+            **modeladmin.admin_site.each_context(request),
+            'title': 'Подтверждение удаления',
+            'opts': opts,
+            'count': queryset.count(),
+            'comment_count': (
+                Comment.objects.filter(post__in=queryset).count()
+                if modeladmin.model is Post else None),
+            'sample': queryset[:SAMPLE_SIZE],
+            'select_across': request.POST.get('select_across') == '1',
+            'selected': request.POST.getlist(ACTION_CHECKBOX_NAME),
+            'action_checkbox_name': ACTION_CHECKBOX_NAME,
+        })
+
+
+@admin.action(description='Перенести выбранные в категорию')
+def recategorise_selected(modeladmin, request, queryset):
+    category = Category.objects.filter(
+        pk=request.POST.get('category') or None).first()
+    if category is None:
+        modeladmin.message_user(request, 'Выберите категорию',
+                                messages.ERROR)
+        return
+    count = moderation.recategorise(queryset, category)
+    modeladmin.message_user(
+        request, f'Перенесено в категорию «{category}»: {count}')
+
+
+@admin.action(description='Пометить выбранные как спам')
+def mark_spam(modeladmin, request, queryset):
+    spam_filter.train(queryset, is_spam=True)
+    count = moderation.unpublish(queryset)
+    modeladmin.message_user(request, f'Скрыто как спам: {count}')
+
+
+@admin.action(description='Пометить выбранные как не спам')
+def mark_ham(modeladmin, request, queryset):
+    spam_filter.train(queryset, is_spam=False)
+    count = moderation.publish(queryset)
+    modeladmin.message_user(request, f'Опубликовано: {count}')
+
 
 class PostInline(admin.StackedInline):
     model = Post
@@ -27,6 +103,7 @@ class PostAdmin(admin.ModelAdmin):
         'title',
         'pub_date',
         'is_published',
+        'is_visible',
         'author',
         'category',
         'comments_count',
@@ -35,12 +112,25 @@ class PostAdmin(admin.ModelAdmin):
         'is_published',
         'category',
     )
+    list_select_related = ('author', 'category')
     search_fields = ('title',)
-    list_filter = ('is_published',)
+    list_filter = ('is_published', 'is_visible')
+    action_form = ModerationActionForm
+    actions = (
+        publish_selected,
+        unpublish_selected,
+        recategorise_selected,
+        delete_in_batches,
+    )
 
-    @admin.display(description='Комментарии')
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(
+            comment_count=Count('comments'))
+
+    @admin.display(description='Комментарии',
+                   ordering='comment_count')
     def comments_count(self, obj):
-        return obj.comments.count()
+        return obj.comment_count
 
     @admin.display(description='Картинка')
     def post_image(self, obj):
@@ -48,6 +138,33 @@ class PostAdmin(admin.ModelAdmin):
                          ) if (obj.image) else None
 
 
+@admin.register(Comment)
+class CommentAdmin(admin.ModelAdmin):
+    list_display = (
+        '__str__',
+        'post',
+        'author',
+        'created_at',
+        'is_published',
+    )
+    list_editable = ('is_published',)
+    list_select_related = ('post', 'author')
+    list_filter = ('is_published', 'created_at')
+    search_fields = ('text', 'author__username')
+    raw_id_fields = ('post', 'author')
+    actions = (
+        mark_ham,
+        mark_spam,
+        delete_in_batches,
+    )
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        if change and 'is_published' in form.changed_data:
+            spam_filter.train(Comment.objects.filter(pk=obj.pk),
+                              is_spam=not obj.is_published)
+
+
 @admin.register(User)
 class UserAdmin(BaseUserAdmin):
     list_display = ('username', 'is_speaker',
@@ -0,0 +1,98 @@
+import asyncio
+
+from django.core.paginator import Page, Paginator
+from django.db.models import Q
+from django.http import Http404
+
+from core.utils import get_user, render_async, run_query
+from .constants import POST_PAGI_LENGTH
+from .forms import CommentForm
+from .mixins import PostToolsMixin
+from .models import Category, Comment, Post, User
+
+
+async def get_object(queryset, **kwargs):
+    def fetch():
+        return queryset.filter(**kwargs).first()
+    obj = await run_query(fetch)
+    if obj is None:
+        raise Http404
+    return obj
+
+
+async def paginate(request, queryset, count_queryset=None):
+    """Считает объекты и выбирает строки страницы параллельно."""
+    paginator = Paginator(queryset, POST_PAGI_LENGTH)
+    if count_queryset is None:
+        count_queryset = queryset
+    try:
+        number = max(int(request.GET.get('page', 1)), 1)
+    except (TypeError, ValueError):
+        number = 1
+
+    def rows(number):
+        bottom = (number - 1) * paginator.per_page
+        return lambda: list(queryset[bottom:bottom + paginator.per_page])
+
+    count, object_list = await asyncio.gather(
+        run_query(count_queryset.count),
+        run_query(rows(number)),
+    )
+    paginator.count = count
+    if not object_list and number > paginator.num_pages:
+        number = paginator.num_pages
+        object_list = await run_query(rows(number))
+    return Page(object_list, number, paginator)
+
+
+async def post_list(request):
+    posts = Post.objects.visible()
+    page_obj = await paginate(request, PostToolsMixin.post_annotated(posts),
+                              posts)
+    return await render_async(
+        request, 'blog/index.html', {'page_obj': page_obj})
+
+
+async def post_detail(request, post_id):
+    user = await get_user(request)
+    comments = Comment.objects.filter(
+        Q(is_published=True) | Q(author_id=user.pk),
+        post_id=post_id,
+    ).select_related('author')
+    post, page_obj = await asyncio.gather(
+        get_object(Post.objects.select_related('author', 'category'),
+                   pk=post_id),
+        paginate(request, comments),
+    )
+    if not post.is_visible and post.author_id != user.pk:
+        raise Http404('Пост снят с публикации')
+    return await render_async(
+        request, 'blog/detail.html',
+        {'post': post, 'form': CommentForm(), 'page_obj': page_obj})
+
+
+async def category_detail(request, category_slug):
+    posts = Post.objects.visible().filter(category__slug=category_slug)
+    category, page_obj = await asyncio.gather(
+        get_object(Category.objects, slug=category_slug),
+        paginate(request, PostToolsMixin.post_annotated(posts), posts),
+    )
+    if not category.is_published:
+        raise Http404('Категория снята с публикации')
+    return await render_async(
+        request, 'blog/category.html',
+        {'category': category, 'page_obj': page_obj})
+
+
+async def profile_detail(request, username):
+    user = await get_user(request)
+    posts = Post.objects.filter(author__username=username)
+    if user.username != username:
+        posts = posts.visible()
+    profile, page_obj = await asyncio.gather(
+        get_object(User.objects, username=username),
+        paginate(request, PostToolsMixin.post_annotated(posts), posts),
+    )
+    return await render_async(
+        request, 'blog/profile.html',
+        {'profile': profile, 'page_obj': page_obj})
@@ -1,3 +1,8 @@
 MAX_LENGTH = 256
+MODERATION_BATCH_SIZE = 1000
 POST_PAGI_LENGTH = 10
+SPAM_BUCKETS = 2 ** 16
+SPAM_MAX_TOKENS = 300
+SPAM_MIN_DOCUMENTS = 20
+SPAM_THRESHOLD = 0.9
 STR_LENGTH = 20
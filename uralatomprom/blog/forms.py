@@ -3,7 +3,10 @@ from django.contrib.auth import get_user_model
 from django.contrib.auth.forms import UserCreationForm
 
 from captcha.fields import CaptchaField
+from users.duplicates import BLOCK_SCORE, find_duplicates
+from .images import HeaderImageField
 from .models import Post, Comment
+from .spam import spam_filter
 
 User = get_user_model()
 
@@ -26,6 +29,12 @@ class ParticipantCreationForm(UserCreationForm):
         if not clean_data.get('give_personal_data'):
             raise forms.ValidationError('Необходимо дать согласие '
                                         'на обработку персональных данных!')
+        duplicates = find_duplicates(clean_data)
+        if duplicates and duplicates[0][0] >= BLOCK_SCORE:
+            raise forms.ValidationError('Участник с такими ФИО и контактами '
+                                        'уже зарегистрирован. Если вы '
+                                        'забыли пароль, воспользуйтесь '
+                                        'восстановлением пароля.')
 
 
 class ParticipantChangeForm(forms.ModelForm):
@@ -40,6 +49,7 @@ class PostForm(forms.ModelForm):
     class Meta:
         model = Post
         exclude = ('author',)
+        field_classes = {'image': HeaderImageField}
         widgets = {
             'pub_date': forms.DateInput(
                 format='%Y-%m-%d',
@@ -52,3 +62,13 @@ class CommentForm(forms.ModelForm):
     class Meta:
         model = Comment
         fields = ('text',)
+
+    def save(self, commit=True):
+        # Подозрительные комментарии ждут решения модератора. Правка
+        # может только скрыть комментарий, но не вернуть скрытый.
+        if self.instance._state.adding:
+            self.instance.is_published = not spam_filter.is_spam(
+                self.instance.text)
+        elif spam_filter.is_spam(self.instance.text):
+            self.instance.is_published = False
+        return super().save(commit)
@@ -0,0 +1,110 @@
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+from threading import BoundedSemaphore
+
+from django import forms
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db import close_old_connections
+from PIL import Image, ImageOps
+
+from .models import Post
+
+logger = logging.getLogger(__name__)
+
+Image.MAX_IMAGE_PIXELS = settings.MAX_IMAGE_PIXELS
+JPEG_QUALITY = 85
+QUEUE_TIMEOUT = 1
+
+executor = ThreadPoolExecutor(settings.IMAGE_WORKERS,
+                              thread_name_prefix='images')
+slots = BoundedSemaphore(settings.IMAGE_WORKERS + settings.IMAGE_QUEUE_SIZE)
+
+
+class HeaderImageField(forms.ImageField):
+    """Проверяет только заголовок изображения, не декодируя пиксели.
+
+    Полное декодирование выполняется в фоновом пуле.
+    """
+
+    def to_python(self, data):
+        f = forms.FileField.to_python(self, data)
+        if f is None:
+            return None
+        file = data.temporary_file_path() if hasattr(
+            data, 'temporary_file_path') else data
+        try:
+            image = Image.open(file)
+            width, height = image.size
+        except Exception as exc:
+            raise forms.ValidationError(
+                self.error_messages['invalid_image'],
+                code='invalid_image',
+            ) from exc
+        if width * height > settings.MAX_IMAGE_PIXELS:
+            raise forms.ValidationError(
+                f'Изображение {width}x{height} слишком большое')
+        f.image = image
+        f.content_type = Image.MIME.get(image.format)
+        if hasattr(f, 'seek') and callable(f.seek):
+            f.seek(0)
+        return f
+
+
+def reencode(field_file):
+    """Декодирует изображение, поворачивает по EXIF и сохраняет заново
+    без метаданных. Возвращает имя нового файла в хранилище."""
+    with field_file.open('rb') as file:
+        image = Image.open(file)
+        image.load()
+    image = ImageOps.exif_transpose(image)
+    if image.mode in ('RGBA', 'LA', 'P', 'PA'):
+        image, file_format, extension = image.convert('RGBA'), 'PNG', 'png'
+    else:
+        image, file_format, extension = image.convert('RGB'), 'JPEG', 'jpg'
+    image.info = {}
+    buffer = BytesIO()
+    image.save(buffer, file_format, quality=JPEG_QUALITY, optimize=True)
+    old_name = field_file.name
+    name = field_file.storage.save(
+        f'{os.path.splitext(old_name)[0]}.{extension}',
+        ContentFile(buffer.getvalue()))
+    if name != old_name:
+        field_file.storage.delete(old_name)
+    return name
+
+
+def process_post_image(post_id):
+    post = Post.objects.filter(pk=post_id, image_pending=True).first()
+    if post is None:
+        return
+    name = ''
+    if post.image:
+        try:
+            name = reencode(post.image)
+        except Exception:
+            logger.exception('Не удалось обработать изображение поста %s',
+                             post_id)
+            post.image.delete(save=False)
+    Post.objects.filter(pk=post_id).update(image=name, image_pending=False)
+    Post.objects.filter(pk=post_id).refresh_visibility()
+
+
+def run(post_id):
+    try:
+        process_post_image(post_id)
+    finally:
+        close_old_connections()
+        slots.release()
+
+
+def schedule(post_id):
+    """Ставит обработку в очередь. Если очередь переполнена, пост остается
+    скрытым до запуска команды process_pending_images."""
+    if not slots.acquire(timeout=QUEUE_TIMEOUT):
+        logger.warning('Очередь обработки изображений заполнена, '
+                       'пост %s отложен', post_id)
+        return
+    executor.submit(run, post_id)
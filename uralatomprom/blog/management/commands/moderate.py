@@ -0,0 +1,104 @@
+from datetime import datetime, time, timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.timezone import make_aware
+
+from blog import moderation
+from blog.models import Category, Comment, Post
+
+MODELS = {'posts': Post, 'comments': Comment}
+ACTIONS = ('publish', 'unpublish', 'recategorise', 'delete')
+FILTERS = ('ids', 'author', 'post', 'category', 'contains', 'since', 'until')
+
+
+def day_start(value):
+    try:
+        day = datetime.strptime(value, '%Y-%m-%d').date()
+    except ValueError:
+        raise CommandError(f'Неверная дата: {value}')
+    return make_aware(datetime.combine(day, time.min))
+
+
+class Command(BaseCommand):
+    help = ('Массовая модерация публикаций и комментариев, подходящих '
+            'под фильтр. Изменения выполняются пакетными UPDATE/DELETE.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('target', choices=MODELS)
+        parser.add_argument('action', choices=ACTIONS)
+        parser.add_argument('--ids', help='Идентификаторы через запятую')
+        parser.add_argument('--author', help='Логин автора')
+        parser.add_argument('--post', type=int,
+                            help='Публикация (только для комментариев)')
+        parser.add_argument('--category',
+                            help='Slug категории (только для публикаций)')
+        parser.add_argument('--contains', help='Подстрока в тексте')
+        parser.add_argument('--since', help='Добавлено не раньше YYYY-MM-DD')
+        parser.add_argument('--until', help='Добавлено не позже YYYY-MM-DD')
+        parser.add_argument('--to-category',
+                            help='Slug новой категории для recategorise')
+        parser.add_argument('--dry-run', action='store_true',
+                            help='Только показать число записей')
+        parser.add_argument('--noinput', '--no-input', action='store_false',
+                            dest='interactive',
+                            help='Удалять без запроса подтверждения')
+
+    def get_queryset(self, options):
+        model = MODELS[options['target']]
+        queryset = model.objects.all()
+        if options['ids']:
+            queryset = queryset.filter(pk__in=options['ids'].split(','))
+        if options['author']:
+            queryset = queryset.filter(author__username=options['author'])
+        if options['contains']:
+            queryset = queryset.filter(text__icontains=options['contains'])
+        if options['since']:
+            queryset = queryset.filter(
+                created_at__gte=day_start(options['since']))
+        if options['until']:
+            queryset = queryset.filter(
+                created_at__lt=day_start(options['until']) + timedelta(1))
+        if options['post'] is not None:
+            if model is not Comment:
+                raise CommandError('--post применим только к комментариям')
+            queryset = queryset.filter(post_id=options['post'])
+        if options['category']:
+            if model is not Post:
+                raise CommandError('--category применим только к публикациям')
+            queryset = queryset.filter(category__slug=options['category'])
+        return queryset
+
+    def confirm_delete(self, queryset):
+        message = f'Будет удалено записей: {queryset.count()}'
+        if queryset.model is Post:
+            message += ' вместе с их комментариями'
+        answer = input(f'{message}. Введите «yes» для подтверждения: ')
+        if answer != 'yes':
+            raise CommandError('Удаление отменено')
+
+    def handle(self, *args, **options):
+        if all(options[name] is None for name in FILTERS):
+            raise CommandError('Укажите хотя бы один фильтр: --ids, '
+                               '--author, --post, --category, --contains, '
+                               '--since или --until')
+        queryset = self.get_queryset(options)
+        action = options['action']
+        if options['dry_run']:
+            self.stdout.write(f'Подходит записей: {queryset.count()}')
+            return
+        if action == 'delete' and options['interactive']:
+            self.confirm_delete(queryset)
+        if action == 'recategorise':
+            if queryset.model is not Post:
+                raise CommandError('Перенести в категорию можно '
+                                   'только публикации')
+            category = Category.objects.filter(
+                slug=options['to_category']).first()
+            if category is None:
+                raise CommandError('Укажите существующую категорию '
+                                   'в --to-category')
+            count = moderation.recategorise(queryset, category)
+        else:
+            count = getattr(moderation, action)(queryset)
+        self.stdout.write(self.style.SUCCESS(
+            f'{action}: обработано записей {count}'))
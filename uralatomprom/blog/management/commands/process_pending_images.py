@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from blog.images import process_post_image
+from blog.models import Post
+
+
+class Command(BaseCommand):
+    help = ('Обрабатывает изображения публикаций, оставшиеся в очереди '
+            '(например, после перезапуска сервера).')
+
+    def handle(self, *args, **options):
+        pending = list(Post.objects.filter(
+            image_pending=True).values_list('pk', flat=True))
+        for post_id in pending:
+            process_post_image(post_id)
+        self.stdout.write(f'Обработано изображений: {len(pending)}')
@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from blog.models import Post
+
+
+class Command(BaseCommand):
+    help = ('Пересчитывает видимость публикаций: открывает отложенные '
+            'посты, дата публикации которых наступила. Запускается '
+            'по расписанию (cron) раз в сутки после полуночи.')
+
+    def handle(self, *args, **options):
+        changed = Post.objects.refresh_visibility()
+        self.stdout.write(f'Изменена видимость публикаций: {changed}')
@@ -0,0 +1,109 @@
+import os
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Max
+
+from blog import seeding
+from blog.models import Category, Comment, Post
+from core.utils import process_pool
+from users import duplicates, rollups
+
+User = get_user_model()
+DEFAULT_PASSWORD = 'uralatomprom'
+
+
+def next_id(model):
+    return (model.objects.aggregate(last=Max('pk'))['last'] or 0) + 1
+
+
+def chunks(start_id, total, size):
+    for chunk, offset in enumerate(range(0, total, size)):
+        yield chunk, start_id + offset, min(size, total - offset)
+
+
+class Command(BaseCommand):
+    help = ('Заполняет базу реалистичными тестовыми данными: участники, '
+            'категории, публикации и комментарии. Результат определяется '
+            'зерном --seed и не зависит от числа процессов.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--participants', type=int, default=100_000)
+        parser.add_argument('--staff', type=int, default=20)
+        parser.add_argument('--categories', type=int, default=20)
+        parser.add_argument('--posts', type=int, default=50_000)
+        parser.add_argument('--comments', type=int, default=300_000)
+        parser.add_argument('--seed', type=int, default=1)
+        parser.add_argument('--batch-size', type=int, default=2000)
+        parser.add_argument('--workers', type=int, default=os.cpu_count())
+
+    def insert(self, pool, model, generate, tasks, batch_size):
+        created = 0
+        for rows in pool.imap(generate, tasks):
+            with transaction.atomic():
+                model.objects.bulk_create(
+                    (model(**row) for row in rows), batch_size=batch_size)
+            created += len(rows)
+            self.stdout.write(f'{model._meta.verbose_name_plural}: '
+                              f'{created}', ending='\r')
+        self.stdout.write('')
+
+    def check_options(self, options):
+        authors = min(options['staff'], options['participants'])
+        if options['posts'] and not (authors and options['categories']):
+            raise CommandError('Для публикаций нужны авторы и категории: '
+                               '--staff, --participants и --categories '
+                               'должны быть больше нуля')
+        if options['comments'] and not (options['posts']
+                                        and options['participants']):
+            raise CommandError('Для комментариев нужны публикации и '
+                               'участники: --posts и --participants '
+                               'должны быть больше нуля')
+
+    def handle(self, *args, **options):
+        self.check_options(options)
+        seed, size = options['seed'], options['batch_size']
+        password = make_password(DEFAULT_PASSWORD)
+
+        user_start = next_id(User)
+        staff_until = user_start + min(options['staff'],
+                                       options['participants'])
+        category_start = next_id(Category)
+        Category.objects.bulk_create(
+            Category(**row) for row in seeding.categories(
+                seed, category_start, options['categories']))
+        category_ids = list(range(category_start,
+                                  category_start + options['categories']))
+        post_start, comment_start = next_id(Post), next_id(Comment)
+
+        with process_pool(options['workers']) as pool:
+            self.insert(pool, User, seeding.participants, [
+                (seed, chunk, start, count, staff_until, password)
+                for chunk, start, count in chunks(
+                    user_start, options['participants'], size)
+            ], size)
+            if options['posts']:
+                author_ids = list(range(user_start, staff_until))
+                self.insert(pool, Post, seeding.posts, [
+                    (seed, chunk, start, count, author_ids, category_ids)
+                    for chunk, start, count in chunks(
+                        post_start, options['posts'], size)
+                ], size)
+            if options['comments']:
+                self.insert(pool, Comment, seeding.comments, [
+                    (seed, chunk, start, count,
+                     (post_start, options['posts']),
+                     (user_start, options['participants']))
+                    for chunk, start, count in chunks(
+                        comment_start, options['comments'], size)
+                ], size)
+
+        # bulk_create не вызывает save() и сигналы, поэтому производные
+        # данные пересчитываются целиком.
+        Post.objects.refresh_visibility()
+        rollups.rebuild(User.objects.all())
+        duplicates.reindex(User.objects.all(), size)
+        self.stdout.write(self.style.SUCCESS(
+            f'Готово. Пароль тестовых участников: {DEFAULT_PASSWORD}'))
@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand
+
+from blog.models import Comment
+from blog.spam import spam_filter
+
+CHUNK_SIZE = 2000
+
+
+class Command(BaseCommand):
+    help = ('Обучает спам-фильтр заново по всем комментариям: '
+            'опубликованные считаются обычными, скрытые — спамом.')
+
+    def handle(self, *args, **options):
+        spam_filter.reset()
+        for is_published in (True, False):
+            texts = Comment.objects.filter(
+                is_published=is_published).values_list('text', flat=True)
+            chunk = []
+            for text in texts.iterator(chunk_size=CHUNK_SIZE):
+                chunk.append(text)
+                if len(chunk) == CHUNK_SIZE:
+                    spam_filter.learn(chunk, is_spam=not is_published)
+                    chunk = []
+            spam_filter.learn(chunk, is_spam=not is_published)
+            Comment.objects.filter(is_published=is_published).update(
+                spam_label=not is_published)
+        self.stdout.write(self.style.SUCCESS('Спам-фильтр обучен'))
@@ -0,0 +1,31 @@
+from django.db import migrations, models
+from django.utils.timezone import localdate
+
+
+def fill_visibility(apps, schema_editor):
+    Post = apps.get_model('blog', 'Post')
+    Post.objects.filter(
+        is_published=True,
+        pub_date__lte=localdate(),
+        category__is_published=True,
+    ).update(is_visible=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0003_alter_post_image'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='is_visible',
+            field=models.BooleanField(default=False, editable=False, help_text='Вычисляется автоматически по флагам публикации поста и категории и по дате публикации.', verbose_name='Виден читателям'),
+        ),
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['is_visible', 'pub_date'], name='post_visible_pub_date_idx'),
+        ),
+        migrations.RunPython(fill_visibility, migrations.RunPython.noop),
+    ]
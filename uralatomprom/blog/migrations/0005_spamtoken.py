@@ -0,0 +1,23 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0004_post_is_visible'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SpamToken',
+            fields=[
+                ('bucket', models.PositiveIntegerField(primary_key=True, serialize=False, verbose_name='Корзина токенов')),
+                ('spam', models.PositiveIntegerField(default=0, verbose_name='Встречается в спаме')),
+                ('ham', models.PositiveIntegerField(default=0, verbose_name='Встречается в обычных')),
+            ],
+            options={
+                'verbose_name': 'статистика спам-фильтра',
+                'verbose_name_plural': 'Статистика спам-фильтра',
+            },
+        ),
+    ]
@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0005_spamtoken'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='post',
+            name='image_pending',
+            field=models.BooleanField(default=False, editable=False, verbose_name='Изображение обрабатывается'),
+        ),
+    ]
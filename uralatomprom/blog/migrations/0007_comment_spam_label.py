@@ -0,0 +1,16 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('blog', '0006_post_image_pending'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='comment',
+            name='spam_label',
+            field=models.BooleanField(editable=False, null=True, verbose_name='Учтен спам-фильтром как спам'),
+        ),
+    ]
@@ -1,9 +1,16 @@
+from functools import partial
+
 from django.contrib.auth.mixins import LoginRequiredMixin, UserPassesTestMixin
+from django.db import transaction
 from django.shortcuts import redirect
 from django.urls import reverse
-from django.db.models import Count
+from django.db.models import Count, Q
 from django.core.paginator import Paginator
+from django.views.decorators.csrf import csrf_exempt, csrf_protect
+
+from core.uploadhandlers import LimitedUploadHandler
 
+from . import images
 from .constants import POST_PAGI_LENGTH
 from .models import Post, Comment
 from .forms import PostForm
@@ -15,7 +22,9 @@ class PostToolsMixin:
         return posts.select_related(
             'author',
             'category').annotate(
-                comment_count=Count('comments')).order_by('-pub_date')
+                comment_count=Count(
+                    'comments', filter=Q(comments__is_published=True))
+            ).order_by('-pub_date')
 
     def obj_paginator(self, post_list):
         paginator = Paginator(post_list, POST_PAGI_LENGTH)
@@ -23,6 +32,53 @@ class PostToolsMixin:
         return paginator.get_page(page_number)
 
 
+class UploadErrorsMixin:
+    """Проверяет загрузки LimitedUploadHandler и показывает его ошибки
+    в форме.
+
+    CsrfViewMiddleware читает request.POST до представления, поэтому
+    проверка CSRF переносится внутрь dispatch, после установки
+    обработчика загрузок.
+    """
+
+    @classmethod
+    def as_view(cls, **initkwargs):
+        return csrf_exempt(super().as_view(**initkwargs))
+
+    def dispatch(self, request, *args, **kwargs):
+        request.upload_handlers.insert(0, LimitedUploadHandler(request))
+        return csrf_protect(super().dispatch)(request, *args, **kwargs)
+
+    def add_upload_errors(self, form):
+        errors = self.request.__dict__.pop('upload_errors', {})
+        for field, message in errors.items():
+            form.add_error(field, message)
+        return bool(errors)
+
+    def form_valid(self, form):
+        if self.add_upload_errors(form):
+            return self.form_invalid(form)
+        return super().form_valid(form)
+
+    def form_invalid(self, form):
+        self.add_upload_errors(form)
+        return super().form_invalid(form)
+
+
+class PostImageMixin(UploadErrorsMixin):
+    """Скрывает пост, пока новое изображение обрабатывается в фоне."""
+
+    def form_valid(self, form):
+        pending = ('image' in form.changed_data
+                   and bool(form.cleaned_data.get('image')))
+        if pending:
+            form.instance.image_pending = True
+        response = super().form_valid(form)
+        if pending and self.object.image_pending:
+            transaction.on_commit(partial(images.schedule, self.object.pk))
+        return response
+
+
 class AuthorPassMixin(UserPassesTestMixin):
     def test_func(self):
         return (self.get_object().author == self.request.user)
@@ -36,7 +92,7 @@ class UserInStaffMixin(UserPassesTestMixin):
         return redirect('blog:index')
 
 
-class PostMixin(LoginRequiredMixin, AuthorPassMixin):
+class PostMixin(LoginRequiredMixin, AuthorPassMixin, PostImageMixin):
     model = Post
     template_name = 'blog/create.html'
     pk_url_kwarg = 'post_id'
@@ -1,6 +1,8 @@
 from django.db import models
+from django.db.models import Q
 from django.contrib.auth import get_user_model
 from django.urls import reverse
+from django.utils.timezone import localdate
 
 from core.models import PublishedModel
 from .constants import MAX_LENGTH, STR_LENGTH
@@ -26,6 +28,26 @@ class Category(PublishedModel):
     def __str__(self):
         return self.title[:STR_LENGTH]
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        self.posts.refresh_visibility()
+
+
+class PostQuerySet(models.QuerySet):
+    def visible(self):
+        return self.filter(is_visible=True)
+
+    def refresh_visibility(self):
+        shown = Q(is_published=True,
+                  image_pending=False,
+                  pub_date__lte=localdate(),
+                  category__is_published=True)
+        return (
+            self.filter(shown, is_visible=False).update(is_visible=True)
+            + self.exclude(shown).filter(is_visible=True).update(
+                is_visible=False)
+        )
+
 
 class Post(PublishedModel):
     title = models.CharField('Заголовок', max_length=MAX_LENGTH)
@@ -48,16 +70,46 @@ class Post(PublishedModel):
     image = models.ImageField('Изображение',
                               upload_to='post_images',
                               blank=True)
+    image_pending = models.BooleanField(
+        'Изображение обрабатывается',
+        default=False,
+        editable=False)
+    is_visible = models.BooleanField(
+        'Виден читателям',
+        default=False,
+        editable=False,
+        help_text=('Вычисляется автоматически по флагам публикации '
+                   'поста и категории и по дате публикации.'))
+
+    objects = PostQuerySet.as_manager()
 
     class Meta:
         verbose_name = 'публикация'
         verbose_name_plural = 'Публикации'
         default_related_name = 'posts'
         ordering = ('-pub_date', 'title')
+        indexes = (
+            models.Index(fields=('is_visible', 'pub_date'),
+                         name='post_visible_pub_date_idx'),
+        )
 
     def __str__(self):
         return self.title[:STR_LENGTH]
 
+    def save(self, *args, **kwargs):
+        self.is_visible = self.compute_visibility()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = {*update_fields, 'is_visible'}
+        super().save(*args, **kwargs)
+
+    def compute_visibility(self):
+        return bool(self.is_published
+                    and not self.image_pending
+                    and self.pub_date <= localdate()
+                    and self.category is not None
+                    and self.category.is_published)
+
     def get_absolute_url(self):
         return reverse('blog:post_detail', kwargs={'post_id': self.pk})
 
@@ -69,6 +121,8 @@ class Comment(PublishedModel):
         on_delete=models.CASCADE,
     )
     author = models.ForeignKey(User, on_delete=models.CASCADE)
+    spam_label = models.BooleanField('Учтен спам-фильтром как спам',
+                                     null=True, editable=False)
 
     class Meta:
         ordering = ('created_at',)
@@ -76,3 +130,16 @@ class Comment(PublishedModel):
 
     def __str__(self):
         return self.text[:STR_LENGTH]
+
+
+class SpamToken(models.Model):
+    bucket = models.PositiveIntegerField('Корзина токенов', primary_key=True)
+    spam = models.PositiveIntegerField('Встречается в спаме', default=0)
+    ham = models.PositiveIntegerField('Встречается в обычных', default=0)
+
+    class Meta:
+        verbose_name = 'статистика спам-фильтра'
+        verbose_name_plural = 'Статистика спам-фильтра'
+
+    def __str__(self):
+        return str(self.bucket)
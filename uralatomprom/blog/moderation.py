@@ -0,0 +1,44 @@
+from django.db import transaction
+
+from .constants import MODERATION_BATCH_SIZE
+from .models import Post
+
+
+def batches(queryset, size=MODERATION_BATCH_SIZE):
+    pks = list(queryset.order_by().values_list('pk', flat=True))
+    for start in range(0, len(pks), size):
+        yield pks[start:start + size]
+
+
+def update(queryset, **values):
+    """Обновляет записи пакетами одним UPDATE на пакет."""
+    model = queryset.model
+    updated = 0
+    for pks in batches(queryset):
+        with transaction.atomic():
+            updated += model.objects.filter(pk__in=pks).update(**values)
+            if model is Post:
+                Post.objects.filter(pk__in=pks).refresh_visibility()
+    return updated
+
+
+def publish(queryset):
+    return update(queryset, is_published=True)
+
+
+def unpublish(queryset):
+    return update(queryset, is_published=False)
+
+
+def recategorise(queryset, category):
+    return update(queryset, category=category)
+
+
+def delete(queryset):
+    model = queryset.model
+    deleted = 0
+    for pks in batches(queryset):
+        with transaction.atomic():
+            _, per_model = model.objects.filter(pk__in=pks).delete()
+        deleted += per_model.get(model._meta.label, 0)
+    return deleted
@@ -0,0 +1,156 @@
+"""Генерация синтетических данных для команды seed.
+
+Функции возвращают словари значений полей моделей и выполняются
+в пуле процессов. Каждая часть данных порождается собственным
+генератором, зерно которого зависит только от общего зерна, вида данных
+и номера части, поэтому результат не зависит от числа процессов.
+"""
+import random
+from datetime import date, datetime, timedelta, timezone
+
+from faker import Faker
+
+ORGANISATION_FORMS = ('АО', 'ФГУП', 'ФГБУН', 'ООО', 'НИИ', 'ФГАОУ ВО')
+KNOWN_ORGANISATIONS = (
+    'ИПЭ УрО РАН', 'УрФУ', 'ИФМ УрО РАН', 'Росатом', 'Белоярская АЭС',
+    'ИХТТ УрО РАН', 'УГМК', 'Уралэлектромедь',
+)
+SPEAKER_SHARE = 0.4
+ABSTRACT_SHARE = 0.6
+DUPLICATE_SHARE = 0.02
+REGISTRATION_DAYS = 90
+PUBLICATION_DAYS = 365
+FUTURE_POST_SHARE = 0.05
+HIDDEN_SHARE = 0.05
+
+
+def make_faker(seed, kind, chunk):
+    key = f'{seed}:{kind}:{chunk}'
+    fake = Faker('ru_RU')
+    fake.seed_instance(key)
+    return fake, random.Random(key)
+
+
+def skewed(rng, size, power=3):
+    """Индекс от 0 до size-1 с перекосом к началу (популярные объекты)."""
+    return int(size * rng.random() ** power)
+
+
+def organisations(seed, count=300):
+    fake, rng = make_faker(seed, 'organisations', 0)
+    names = list(KNOWN_ORGANISATIONS)
+    while len(names) < count:
+        names.append(f'{rng.choice(ORGANISATION_FORMS)} '
+                     f'«{fake.last_name_male()}»')
+    return names
+
+
+def person(fake, rng):
+    if rng.random() < 0.5:
+        return ' '.join((fake.last_name_male(), fake.first_name_male(),
+                         fake.middle_name_male()))
+    return ' '.join((fake.last_name_female(), fake.first_name_female(),
+                     fake.middle_name_female()))
+
+
+def vary(values, rng):
+    """Повторная регистрация того же человека с мелкими отличиями."""
+    full_name, organisation, phone, email = values
+    last_name, *rest = full_name.split()
+    variants = (
+        (' '.join([last_name] + [f'{name[0]}.' for name in rest]),
+         organisation, phone, email.upper()),
+        (full_name.lower(), f' {organisation} ',
+         phone.replace('+7', '8'), email),
+        (full_name, organisation, phone, f'{email.split("@")[0]}@mail.ru'),
+    )
+    return rng.choice(variants)
+
+
+def participants(args):
+    seed, chunk, start_id, count, staff_until, password = args
+    fake, rng = make_faker(seed, 'participants', chunk)
+    pool = organisations(seed)
+    today = datetime.now(timezone.utc).replace(hour=12, minute=0, second=0,
+                                               microsecond=0)
+    rows, previous = [], []
+    for pk in range(start_id, start_id + count):
+        username = f'user{pk}'
+        if previous and rng.random() < DUPLICATE_SHARE:
+            full_name, organisation, phone, email = vary(
+                rng.choice(previous), rng)
+        else:
+            full_name = person(fake, rng)
+            organisation = pool[skewed(rng, len(pool))]
+            phone = fake.phone_number()
+            email = (f'{fake.user_name()}{pk}@'
+                     f'{fake.free_email_domain()}')
+            previous.append((full_name, organisation, phone, email))
+        is_speaker = rng.random() < SPEAKER_SHARE
+        has_abstract = is_speaker and rng.random() < ABSTRACT_SHARE
+        # Регистраций больше ближе к концу приема заявок.
+        days_ago = int(REGISTRATION_DAYS * (1 - rng.random() ** 0.5))
+        rows.append(dict(
+            id=pk,
+            username=username,
+            password=password,
+            is_staff=pk < staff_until,
+            full_name=full_name,
+            organisation=organisation,
+            phone=phone,
+            email=email,
+            is_speaker=is_speaker,
+            abstract=f'abstracts/{username}.doc' if has_abstract else '',
+            date_joined=today - timedelta(days=days_ago,
+                                          minutes=rng.randrange(1440)),
+        ))
+    return rows
+
+
+def posts(args):
+    seed, chunk, start_id, count, author_ids, category_ids = args
+    fake, rng = make_faker(seed, 'posts', chunk)
+    today = date.today()
+    rows = []
+    for pk in range(start_id, start_id + count):
+        if rng.random() < FUTURE_POST_SHARE:
+            pub_date = today + timedelta(days=rng.randrange(1, 30))
+        else:
+            pub_date = today - timedelta(
+                days=rng.randrange(PUBLICATION_DAYS))
+        rows.append(dict(
+            id=pk,
+            title=fake.sentence(nb_words=6)[:256],
+            text='\n\n'.join(fake.paragraphs(nb=rng.randint(2, 8))),
+            pub_date=pub_date,
+            is_published=rng.random() >= HIDDEN_SHARE,
+            author_id=rng.choice(author_ids),
+            category_id=category_ids[skewed(rng, len(category_ids), 2)],
+        ))
+    return rows
+
+
+def comments(args):
+    seed, chunk, start_id, count, post_range, author_range = args
+    fake, rng = make_faker(seed, 'comments', chunk)
+    rows = []
+    for pk in range(start_id, start_id + count):
+        rows.append(dict(
+            id=pk,
+            text=fake.paragraph(nb_sentences=rng.randint(1, 4)),
+            is_published=rng.random() >= HIDDEN_SHARE,
+            post_id=post_range[0] + skewed(rng, post_range[1]),
+            author_id=author_range[0] + rng.randrange(author_range[1]),
+        ))
+    return rows
+
+
+def categories(seed, start_id, count):
+    fake, rng = make_faker(seed, 'categories', 0)
+    return [dict(
+        id=pk,
+        title=fake.sentence(nb_words=3).rstrip('.'),
+        description=fake.paragraph(nb_sentences=2),
+        slug=f'category-{pk}',
+        is_published=rng.random() >= HIDDEN_SHARE,
+    ) for pk in range(start_id, start_id + count)]
@@ -0,0 +1,10 @@
+from django.db.models.signals import pre_delete
+from django.dispatch import receiver
+
+from .models import Category
+
+
+@receiver(pre_delete, sender=Category)
+def hide_orphaned_posts(sender, instance, **kwargs):
+    # Посты удаляемой категории получат category=NULL без вызова save().
+    instance.posts.update(is_visible=False)
@@ -0,0 +1,127 @@
+import math
+import re
+import zlib
+from array import array
+from collections import Counter, defaultdict
+
+from django.db import transaction
+from django.db.models import F
+from django.db.models.functions import Greatest
+
+from .constants import (SPAM_BUCKETS, SPAM_MAX_TOKENS, SPAM_MIN_DOCUMENTS,
+                        SPAM_THRESHOLD)
+from .models import SpamToken
+
+TOKEN_RE = re.compile(r'https?://[^\s/]+|\w+')
+# Корзина 0 хранит число документов каждого класса, а строка VERSION
+# за пределами массивов — счетчик изменений модели.
+TOTALS = 0
+VERSION = SPAM_BUCKETS
+MAX_LOG_ODDS = 50
+
+
+def token_buckets(text):
+    """Множество корзин токенов текста (hashing trick поверх crc32)."""
+    tokens = TOKEN_RE.findall(text.lower())[:SPAM_MAX_TOKENS]
+    return {zlib.crc32(token.encode()) % (SPAM_BUCKETS - 1) + 1
+            for token in tokens}
+
+
+class SpamFilter:
+    """Наивный байесовский классификатор комментариев.
+
+    Частоты токенов лежат в двух массивах array('I') по SPAM_BUCKETS
+    элементов и перечитываются из БД, когда другой процесс дообучил
+    модель (версия хранится в служебной строке SpamToken).
+    """
+
+    def __init__(self):
+        self.version = None
+        self.spam = self.ham = None
+
+    def refresh(self):
+        version = SpamToken.objects.filter(bucket=VERSION).values_list(
+            'spam', flat=True).first() or 0
+        if version == self.version:
+            return
+        spam = array('I', [0]) * SPAM_BUCKETS
+        ham = array('I', [0]) * SPAM_BUCKETS
+        for bucket, spam_count, ham_count in SpamToken.objects.filter(
+                bucket__lt=SPAM_BUCKETS).values_list(
+                    'bucket', 'spam', 'ham').iterator():
+            spam[bucket] = spam_count
+            ham[bucket] = ham_count
+        self.spam, self.ham, self.version = spam, ham, version
+
+    def probability(self, text):
+        self.refresh()
+        spam_docs, ham_docs = self.spam[TOTALS], self.ham[TOTALS]
+        if (not spam_docs or not ham_docs
+                or spam_docs + ham_docs < SPAM_MIN_DOCUMENTS):
+            return 0.0
+        log_odds = math.log(spam_docs / ham_docs)
+        for bucket in token_buckets(text):
+            log_odds += (
+                math.log((self.spam[bucket] + 1) / (spam_docs + 2))
+                - math.log((self.ham[bucket] + 1) / (ham_docs + 2))
+            )
+        log_odds = max(-MAX_LOG_ODDS, min(MAX_LOG_ODDS, log_odds))
+        return 1 / (1 + math.exp(-log_odds))
+
+    def is_spam(self, text):
+        return self.probability(text) >= SPAM_THRESHOLD
+
+    @staticmethod
+    def bump_version():
+        SpamToken.objects.bulk_create([SpamToken(bucket=VERSION)],
+                                      ignore_conflicts=True)
+        SpamToken.objects.filter(bucket=VERSION).update(spam=F('spam') + 1)
+
+    def reset(self):
+        with transaction.atomic():
+            SpamToken.objects.exclude(bucket=VERSION).delete()
+            self.bump_version()
+
+    def update_counts(self, texts, is_spam, sign):
+        counts = Counter()
+        for text in texts:
+            counts.update(token_buckets(text))
+            counts[TOTALS] += 1
+        if not counts:
+            return
+        field = 'spam' if is_spam else 'ham'
+        by_increment = defaultdict(list)
+        for bucket, increment in counts.items():
+            by_increment[increment].append(bucket)
+        with transaction.atomic():
+            SpamToken.objects.bulk_create(
+                [SpamToken(bucket=bucket) for bucket in counts],
+                ignore_conflicts=True)
+            for increment, buckets in by_increment.items():
+                # Текст мог измениться после обучения, поэтому счетчики
+                # не опускаются ниже нуля.
+                SpamToken.objects.filter(bucket__in=buckets).update(
+                    **{field: Greatest(F(field) + sign * increment, 0)})
+            self.bump_version()
+
+    def learn(self, texts, is_spam):
+        self.update_counts(texts, is_spam, 1)
+
+    def unlearn(self, texts, is_spam):
+        self.update_counts(texts, is_spam, -1)
+
+    def train(self, comments, is_spam):
+        """Обучает фильтр решением модератора по комментариям.
+
+        Комментарии, ранее учтенные в противоположном классе, сначала
+        вычитаются из него, а уже учтенные в этом классе пропускаются.
+        """
+        with transaction.atomic():
+            self.unlearn(comments.filter(spam_label=not is_spam).values_list(
+                'text', flat=True), not is_spam)
+            comments = comments.exclude(spam_label=is_spam)
+            self.learn(comments.values_list('text', flat=True), is_spam)
+            comments.update(spam_label=is_spam)
+
+
+spam_filter = SpamFilter()
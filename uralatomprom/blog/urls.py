@@ -1,15 +1,16 @@
 from django.urls import path
 
-from . import views
+from core.utils import read_view
+from . import async_views, views
 
 app_name = 'news'
 
 urlpatterns = [
     path('',
-         views.PostListView.as_view(),
+         read_view(views.PostListView, async_views.post_list),
          name='index'),
     path('posts/<int:post_id>/',
-         views.PostDetailView.as_view(),
+         read_view(views.PostDetailView, async_views.post_detail),
          name='post_detail'),
     path('posts/<int:post_id>/edit/',
          views.PostUpdateView.as_view(),
@@ -21,14 +22,14 @@ urlpatterns = [
          views.PostCreateView.as_view(),
          name='create_post'),
     path('category/<slug:category_slug>/',
-         views.CategoryDetailView.as_view(),
+         read_view(views.CategoryDetailView, async_views.category_detail),
          name='category_posts'),
 
     path('profile/edit/',
          views.ProfileUpdateView.as_view(),
          name='edit_profile'),
     path('profile/<slug:username>/',
-         views.ProfileDetailView.as_view(),
+         read_view(views.ProfileDetailView, async_views.profile_detail),
          name='profile'),
 
     path('posts/<int:post_id>/comment/',
@@ -1,6 +1,6 @@
-from django.utils.timezone import now
 from django.urls import reverse, reverse_lazy
 from django.http import Http404
+from django.db.models import Q
 from django.views.generic import (
     CreateView, DeleteView, DetailView, ListView, UpdateView
 )
@@ -12,11 +12,12 @@ from .constants import POST_PAGI_LENGTH
 from .models import Post, Category, User
 from .forms import (ParticipantCreationForm, ParticipantChangeForm,
                     CommentForm, PostForm)
-from .mixins import (PostToolsMixin, AuthorPassMixin,
-                     PostMixin, CommentMixin, UserInStaffMixin)
+from .mixins import (PostToolsMixin, AuthorPassMixin, PostImageMixin,
+                     PostMixin, CommentMixin, UploadErrorsMixin,
+                     UserInStaffMixin)
 
 
-class ProfileCreateView(CreateView):
+class ProfileCreateView(UploadErrorsMixin, CreateView):
     template_name = 'registration/registration_form.html'
     form_class = ParticipantCreationForm
     success_url = reverse_lazy('blog:index')
@@ -39,17 +40,13 @@ class ProfileDetailView(PostToolsMixin, DetailView):
         context = super().get_context_data(**kwargs)
         post_list = self.post_annotated(self.object.posts)
         if self.object != self.request.user:
-            post_list = post_list.filter(
-                is_published=True,
-                pub_date__lte=now(),
-                category__is_published=True
-            )
+            post_list = post_list.visible()
         context['profile'] = self.object
         context['page_obj'] = self.obj_paginator(post_list)
         return context
 
 
-class ProfileUpdateView(LoginRequiredMixin, UpdateView):
+class ProfileUpdateView(LoginRequiredMixin, UploadErrorsMixin, UpdateView):
     template_name = 'blog/user.html'
     form_class = ParticipantChangeForm
 
@@ -69,10 +66,7 @@ class CategoryDetailView(PostToolsMixin, DetailView):
         context = super().get_context_data(**kwargs)
         if not self.object.is_published:
             raise Http404('Категория снята с публикации')
-        post_list = self.post_annotated(self.object.posts).filter(
-            is_published=True,
-            pub_date__lte=now(),
-            category__is_published=True)
+        post_list = self.post_annotated(self.object.posts.visible())
         context['category'] = self.object
         context['page_obj'] = self.obj_paginator(post_list)
         return context
@@ -81,10 +75,7 @@ class CategoryDetailView(PostToolsMixin, DetailView):
 class PostListView(PostToolsMixin, ListView):
     model = Post
     template_name = 'blog/index.html'
-    queryset = PostToolsMixin.post_annotated(
-        Post.objects.filter(is_published=True,
-                            pub_date__lte=now(),
-                            category__is_published=True))
+    queryset = PostToolsMixin.post_annotated(Post.objects.visible())
     paginate_by = POST_PAGI_LENGTH
 
 
@@ -94,18 +85,21 @@ class PostDetailView(PostToolsMixin, DetailView):
     template_name = 'blog/detail.html'
 
     def get_context_data(self, **kwargs):
-        if ((self.object.author != self.request.user
-             ) and (not self.object.is_published)):
+        if ((not self.object.is_visible
+             ) and (self.object.author_id != self.request.user.pk)):
             raise Http404('Пост снят с публикации')
         context = super().get_context_data(**kwargs)
         context['form'] = CommentForm()
         context['page_obj'] = (
-            self.obj_paginator(self.object.comments.select_related('author'))
+            self.obj_paginator(self.object.comments.filter(
+                Q(is_published=True) | Q(author_id=self.request.user.pk)
+            ).select_related('author'))
         )
         return context
 
 
-class PostCreateView(LoginRequiredMixin, UserInStaffMixin, CreateView):
+class PostCreateView(LoginRequiredMixin, UserInStaffMixin, PostImageMixin,
+                     CreateView):
     model = Post
     template_name = 'blog/create.html'
     form_class = PostForm
@@ -0,0 +1,79 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.functional import SimpleLazyObject
+
+ANONYMOUS = {'is_authenticated': False, 'is_staff': False, 'username': ''}
+
+
+HEADER_FIELDS = {'username', 'is_staff', 'is_active'}
+
+
+def header_user_key(session_key):
+    return f'header-user:{session_key}'
+
+
+def header_sessions_key(user_pk):
+    return f'header-user-sessions:{user_pk}'
+
+
+def header_snapshot(user):
+    return {
+        'is_authenticated': user.is_authenticated,
+        'is_staff': user.is_staff,
+        'username': user.get_username(),
+    }
+
+
+def cache_header_user(session_key, user):
+    snapshot = header_snapshot(user)
+    cache.set(header_user_key(session_key), snapshot,
+              settings.SESSION_COOKIE_AGE)
+    if user.is_authenticated:
+        # Сессии пользователя нужны, чтобы сбросить их снимки при изменении
+        # учетной записи.
+        sessions = cache.get(header_sessions_key(user.pk), set())
+        if session_key not in sessions:
+            cache.set(header_sessions_key(user.pk), sessions | {session_key},
+                      settings.SESSION_COOKIE_AGE)
+    return snapshot
+
+
+def invalidate_header_user(request, user=None):
+    session_key = request.session.session_key
+    if not session_key:
+        return
+    cache.delete(header_user_key(session_key))
+    if user is not None and user.is_authenticated:
+        sessions = cache.get(header_sessions_key(user.pk), set())
+        if session_key in sessions:
+            cache.set(header_sessions_key(user.pk), sessions - {session_key},
+                      settings.SESSION_COOKIE_AGE)
+
+
+def invalidate_user_headers(user_pk):
+    sessions = cache.get(header_sessions_key(user_pk), set())
+    cache.delete_many([header_user_key(key) for key in sessions])
+
+
+def get_header_user(request):
+    """Снимок пользователя для шапки, закешированный по ключу сессии.
+
+    Снимок сохраняется при входе и удаляется при выходе, поэтому обычно
+    шапка не загружает ни сессию, ни пользователя. Если представление
+    уже загрузило пользователя, кеш не запрашивается. При промахе кеша
+    пользователь загружается из сессии, и снимок сохраняется заново.
+    """
+    user = getattr(request, '_cached_user', None)
+    if user is not None:
+        return header_snapshot(user)
+    session_key = request.session.session_key
+    if not session_key:
+        return ANONYMOUS
+    snapshot = cache.get(header_user_key(session_key))
+    if snapshot is None:
+        snapshot = cache_header_user(session_key, request.user)
+    return snapshot
+
+
+def header_user(request):
+    return {'header_user': SimpleLazyObject(lambda: get_header_user(request))}
@@ -0,0 +1,39 @@
+import atexit
+import logging
+import os
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+
+class JSONLinesQueueHandler(QueueHandler):
+    """Отдает записи в фоновый поток, который пишет их в ротируемый файл.
+
+    Запрос не ждет дискового ввода-вывода: emit только кладет запись
+    в очередь. Ротация одного файла из нескольких процессов небезопасна,
+    поэтому каждый процесс пишет в свой файл с PID в имени; поток записи
+    запускается при первой записи уже в рабочем процессе.
+    """
+
+    def __init__(self, filename, maxBytes=10 * 2 ** 20, backupCount=5):
+        super().__init__(queue.SimpleQueue())
+        os.makedirs(os.path.dirname(filename), exist_ok=True)
+        self.filename = filename
+        self.max_bytes = maxBytes
+        self.backup_count = backupCount
+        self.pid = None
+
+    def start(self):
+        self.pid = os.getpid()
+        self.queue = queue.SimpleQueue()
+        file_handler = RotatingFileHandler(
+            f'{self.filename}.{self.pid}', maxBytes=self.max_bytes,
+            backupCount=self.backup_count, encoding='utf-8', delay=True)
+        file_handler.setFormatter(logging.Formatter('%(message)s'))
+        self.listener = QueueListener(self.queue, file_handler)
+        self.listener.start()
+        atexit.register(self.listener.stop)
+
+    def emit(self, record):
+        if self.pid != os.getpid():
+            self.start()
+        super().emit(record)
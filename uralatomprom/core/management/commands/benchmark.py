@@ -0,0 +1,60 @@
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import cycle, islice
+from urllib.error import URLError
+from urllib.request import urlopen
+
+from django.core.management.base import BaseCommand
+
+DEFAULT_PATHS = ('/', '/pages/about/')
+
+
+def fetch(url, timeout):
+    started = time.perf_counter()
+    try:
+        with urlopen(url, timeout=timeout) as response:
+            response.read()
+            ok = response.status < 400
+    except (URLError, OSError):
+        ok = False
+    return ok, time.perf_counter() - started
+
+
+class Command(BaseCommand):
+    help = ('Нагрузочный тест страниц для чтения: параллельные запросы '
+            'к запущенному серверу. Запустите один раз против WSGI, '
+            'второй раз против ASGI с ASYNC_VIEWS=True и сравните.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'base_url', help='Адрес сервера, например http://127.0.0.1:8000')
+        parser.add_argument('--path', action='append', dest='paths',
+                            help='Путь страницы (можно указать несколько раз)')
+        parser.add_argument('--requests', type=int, default=1000)
+        parser.add_argument('--concurrency', type=int, default=50)
+        parser.add_argument('--timeout', type=float, default=30)
+
+    def handle(self, *args, **options):
+        base_url = options['base_url'].rstrip('/')
+        urls = [base_url + path
+                for path in options['paths'] or DEFAULT_PATHS]
+        total = options['requests']
+        started = time.perf_counter()
+        with ThreadPoolExecutor(options['concurrency']) as executor:
+            results = list(executor.map(
+                lambda url: fetch(url, options['timeout']),
+                islice(cycle(urls), total)))
+        elapsed = time.perf_counter() - started
+
+        latencies = sorted(latency for _, latency in results)
+        errors = sum(not ok for ok, _ in results)
+        p95 = latencies[int(len(latencies) * 0.95) - 1]
+        self.stdout.write(
+            f'Запросов: {total}, параллельно: {options["concurrency"]}, '
+            f'ошибок: {errors}\n'
+            f'Пропускная способность: {total / elapsed:.1f} запр./с\n'
+            f'Задержка, мс: медиана '
+            f'{statistics.median(latencies) * 1000:.1f}, '
+            f'p95 {p95 * 1000:.1f}, макс. {latencies[-1] * 1000:.1f}'
+        )
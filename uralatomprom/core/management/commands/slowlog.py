@@ -0,0 +1,74 @@
+import glob
+import json
+from collections import defaultdict
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+GROUPS = ('view', 'path', 'user', 'sql')
+
+
+def percentile(values, fraction):
+    return values[min(len(values) - 1, int(len(values) * fraction))]
+
+
+def read_records(path):
+    for filename in sorted(glob.glob(f'{path}*')):
+        with open(filename, encoding='utf-8') as file:
+            for line in file:
+                try:
+                    yield json.loads(line)
+                except ValueError:
+                    continue
+
+
+class Command(BaseCommand):
+    help = ('Сводка журнала медленных запросов: самые медленные '
+            'представления, адреса, пользователи или SQL-запросы.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--by', choices=GROUPS, default='view')
+        parser.add_argument('--top', type=int, default=20)
+        parser.add_argument('--log', default=str(settings.SLOW_REQUEST_LOG))
+
+    def handle(self, *args, **options):
+        if options['by'] == 'sql':
+            self.show_sql(options)
+        else:
+            self.show_requests(options)
+
+    def show_requests(self, options):
+        groups = defaultdict(list)
+        for record in read_records(options['log']):
+            groups[record.get(options['by'])].append(record)
+        rows = []
+        for key, records in groups.items():
+            durations = sorted(record['ms'] for record in records)
+            rows.append((
+                sum(durations), key, len(records),
+                percentile(durations, 0.5), percentile(durations, 0.95),
+                durations[-1],
+                sum(record['queries'] for record in records) / len(records),
+            ))
+        self.stdout.write('всего мс\tзапросов\tp50\tp95\tмакс\tSQL/запрос\t'
+                          + options['by'])
+        for total, key, count, p50, p95, top, queries in sorted(
+                rows, key=lambda row: row[0], reverse=True)[:options['top']]:
+            self.stdout.write(f'{total:.0f}\t{count}\t{p50:.0f}\t{p95:.0f}\t'
+                              f'{top:.0f}\t{queries:.1f}\t{key}')
+
+    def show_sql(self, options):
+        stats = defaultdict(lambda: [0, 0.0, set()])
+        for record in read_records(options['log']):
+            for query in record['sql']:
+                stat = stats[query['sql']]
+                stat[0] += query['count']
+                stat[1] += query['ms']
+                stat[2].add(record.get('view'))
+        self.stdout.write('всего мс\tвызовов\tпредставления\tзапрос')
+        for sql, (count, total, views) in sorted(
+                stats.items(), key=lambda item: item[1][1],
+                reverse=True)[:options['top']]:
+            self.stdout.write(
+                f'{total:.0f}\t{count}\t'
+                f'{",".join(sorted(map(str, views)))}\t{sql}')
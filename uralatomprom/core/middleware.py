@@ -0,0 +1,128 @@
+import asyncio
+import json
+import logging
+import random
+import re
+import threading
+import time
+from contextvars import ContextVar
+from functools import lru_cache
+
+from django.conf import settings
+from django.utils.timezone import now
+
+logger = logging.getLogger('uralatomprom.slow_requests')
+
+LOGGED_KWARGS = ('post_id', 'comment_id', 'category_slug', 'username')
+MAX_LOGGED_QUERIES = 10
+IN_LIST_RE = re.compile(r'IN \(%s(?:, %s)*\)')
+SPACES_RE = re.compile(r'\s+')
+
+# Таймер текущего запроса. Контекст копируется в потоки sync_to_async,
+# поэтому запросы асинхронных страниц учитываются там, где выполняются.
+query_timer = ContextVar('query_timer', default=None)
+
+
+@lru_cache(maxsize=1024)
+def fingerprint(sql):
+    """Шаблон запроса без длины списков IN и лишних пробелов."""
+    return SPACES_RE.sub(' ', IN_LIST_RE.sub('IN (...)', sql)).strip()
+
+
+def timed_execute(execute, sql, params, many, context):
+    """Обертка запросов, которая устанавливается на каждое соединение."""
+    timer = query_timer.get()
+    if timer is None:
+        return execute(sql, params, many, context)
+    return timer(execute, sql, params, many, context)
+
+
+class QueryTimer:
+    def __init__(self):
+        self.queries = {}
+        self.lock = threading.Lock()
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - started
+            with self.lock:
+                stats = self.queries.setdefault(fingerprint(sql), [0, 0.0])
+                stats[0] += 1
+                stats[1] += duration
+
+    def summary(self):
+        top = sorted(self.queries.items(), key=lambda item: item[1][1],
+                     reverse=True)[:MAX_LOGGED_QUERIES]
+        return [{'sql': sql, 'count': count, 'ms': round(total * 1000, 2)}
+                for sql, (count, total) in top]
+
+
+class SlowRequestMiddleware:
+    """Пишет в журнал выборку запросов дольше SLOW_REQUEST_THRESHOLD_MS."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.threshold = settings.SLOW_REQUEST_THRESHOLD_MS / 1000
+        self.sample_rate = settings.SLOW_REQUEST_SAMPLE_RATE
+        if asyncio.iscoroutinefunction(get_response):
+            # Как в MiddlewareMixin: цепочка остается асинхронной.
+            self._is_coroutine = asyncio.coroutines._is_coroutine
+
+    def __call__(self, request):
+        if asyncio.iscoroutinefunction(self):
+            return self.__acall__(request)
+        timer = QueryTimer()
+        token = query_timer.set(timer)
+        started = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            query_timer.reset(token)
+        self.log(request, response, time.perf_counter() - started, timer)
+        return response
+
+    async def __acall__(self, request):
+        timer = QueryTimer()
+        token = query_timer.set(timer)
+        started = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            query_timer.reset(token)
+        self.log(request, response, time.perf_counter() - started, timer)
+        return response
+
+    def log(self, request, response, duration, timer):
+        if duration >= self.threshold and random.random() < self.sample_rate:
+            logger.warning(json.dumps(
+                self.record(request, response, duration, timer),
+                ensure_ascii=False))
+
+    def record(self, request, response, duration, timer):
+        match = request.resolver_match
+        kwargs = match.kwargs if match else {}
+        # Пользователя не загружаем ради журнала, если view его не трогала.
+        user = getattr(request, '_cached_user', None)
+        return {
+            'time': now().isoformat(),
+            'method': request.method,
+            'path': request.path,
+            'view': match.view_name if match else None,
+            'kwargs': {key: value for key, value in kwargs.items()
+                       if key in LOGGED_KWARGS},
+            'user': user.pk if user is not None else None,
+            'status': response.status_code,
+            'ms': round(duration * 1000, 2),
+            'size': (None if response.streaming
+                     else len(response.content)),
+            'queries': sum(count for count, _ in timer.queries.values()),
+            'sql_ms': round(sum(
+                total for _, total in timer.queries.values()) * 1000, 2),
+            'sql': timer.summary(),
+        }
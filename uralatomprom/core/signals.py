@@ -0,0 +1,34 @@
+from django.conf import settings
+from django.contrib.auth.signals import user_logged_in, user_logged_out
+from django.db import transaction
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+
+from .context_processors import (HEADER_FIELDS, cache_header_user,
+                                 invalidate_header_user,
+                                 invalidate_user_headers)
+from .middleware import timed_execute
+
+
+@receiver(user_logged_in)
+def header_user_logged_in(sender, request, user, **kwargs):
+    cache_header_user(request.session.session_key, user)
+
+
+@receiver(user_logged_out)
+def header_user_logged_out(sender, request, user, **kwargs):
+    invalidate_header_user(request, user)
+
+
+@receiver(post_save, sender=settings.AUTH_USER_MODEL)
+def header_user_changed(sender, instance, update_fields, **kwargs):
+    if update_fields and not HEADER_FIELDS & set(update_fields):
+        return
+    transaction.on_commit(lambda: invalidate_user_headers(instance.pk))
+
+
+@receiver(connection_created)
+def install_query_timer(sender, connection, **kwargs):
+    if timed_execute not in connection.execute_wrappers:
+        connection.execute_wrappers.append(timed_execute)
@@ -0,0 +1,57 @@
+from io import BytesIO
+
+from django.conf import settings
+from django.core.files.uploadhandler import FileUploadHandler, SkipFile
+from django.template.defaultfilters import filesizeformat
+from PIL import Image
+
+# Заголовок изображения с размерами почти всегда умещается в начало файла.
+IMAGE_HEADER_SIZE = 256 * 1024
+
+
+class LimitedUploadHandler(FileUploadHandler):
+    """Проверяет размер файла и число пикселей по мере загрузки.
+
+    UploadErrorsMixin ставит его первым в request.upload_handlers форм
+    участников и публикаций; данные передаются дальше без изменений.
+    Слишком большой файл отбрасывается, не дочитываясь, а ошибка
+    сохраняется в request.upload_errors для формы.
+    """
+
+    def new_file(self, field_name, *args, **kwargs):
+        super().new_file(field_name, *args, **kwargs)
+        self.limit = settings.UPLOAD_SIZE_LIMITS.get(field_name)
+        self.received = 0
+        self.header = (bytearray()
+                       if field_name in settings.IMAGE_UPLOAD_FIELDS
+                       else None)
+
+    def reject(self, message):
+        if not hasattr(self.request, 'upload_errors'):
+            self.request.upload_errors = {}
+        self.request.upload_errors[self.field_name] = message
+        raise SkipFile
+
+    def receive_data_chunk(self, raw_data, start):
+        self.received += len(raw_data)
+        if self.limit is not None and self.received > self.limit:
+            self.reject('Файл больше '
+                        f'{filesizeformat(self.limit)}')
+        if self.header is not None:
+            self.header += raw_data
+            self.check_pixels()
+        return raw_data
+
+    def check_pixels(self):
+        try:
+            width, height = Image.open(BytesIO(self.header)).size
+        except Exception:
+            if len(self.header) >= IMAGE_HEADER_SIZE:
+                self.header = None
+            return
+        self.header = None
+        if width * height > settings.MAX_IMAGE_PIXELS:
+            self.reject(f'Изображение {width}x{height} слишком большое')
+
+    def file_complete(self, file_size):
+        return None
@@ -0,0 +1,57 @@
+from contextlib import contextmanager
+from multiprocessing import Pool
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import close_old_connections, connections
+from django.shortcuts import render
+
+
+def read_view(view_class, async_view):
+    """Выбирает асинхронное представление при ASYNC_VIEWS=True."""
+    if settings.ASYNC_VIEWS:
+        return async_view
+    return view_class.as_view()
+
+
+def _evaluate(func):
+    try:
+        return func()
+    finally:
+        # У каждого потока пула свое соединение: оно остается открытым
+        # до истечения CONN_MAX_AGE и закрывается раньше только после ошибки.
+        close_old_connections()
+
+
+async def run_query(func):
+    """Выполняет синхронный код с запросами к БД в пуле потоков.
+
+    В отличие от sync_to_async по умолчанию, вызовы разных запросов
+    не выстраиваются в очередь к одному общему потоку.
+    """
+    return await sync_to_async(_evaluate, thread_sensitive=False)(func)
+
+
+async def get_user(request):
+    # Сессия и пользователь загружаются в пуле потоков и кешируются
+    # в request, поэтому шаблон их повторно не запрашивает.
+    await run_query(lambda: request.user.is_authenticated)
+    return request.user
+
+
+async def render_async(request, template_name, context=None):
+    """render() в пуле потоков вместе с контекстными процессорами
+    и ленивыми запросами шаблона."""
+    return await run_query(lambda: render(request, template_name, context))
+
+
+@contextmanager
+def process_pool(workers):
+    """Пул процессов для management-команд.
+
+    Соединения с БД закрываются до запуска пула, чтобы дочерние процессы
+    не унаследовали их сокеты.
+    """
+    connections.close_all()
+    with Pool(workers) as pool:
+        yield pool
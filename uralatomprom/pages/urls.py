@@ -1,10 +1,15 @@
 from django.urls import path
 
+from core.utils import read_view
 from . import views
 
 app_name = 'pages'
 
 urlpatterns = [
-    path('about/', views.AboutPage.as_view(), name='about'),
-    path('venue/', views.RulesPage.as_view(), name='venue'),
+    path('about/',
+         read_view(views.AboutPage, views.about),
+         name='about'),
+    path('venue/',
+         read_view(views.RulesPage, views.venue),
+         name='venue'),
 ]
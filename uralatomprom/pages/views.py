@@ -1,6 +1,8 @@
 from django.views.generic import TemplateView
 from django.shortcuts import render
 
+from core.utils import render_async
+
 
 class AboutPage(TemplateView):
     template_name = 'pages/about.html'
@@ -10,6 +12,14 @@ class RulesPage(TemplateView):
     template_name = 'pages/venue.html'
 
 
+async def about(request):
+    return await render_async(request, AboutPage.template_name)
+
+
+async def venue(request):
+    return await render_async(request, RulesPage.template_name)
+
+
 def page_not_found(request, exception):
     return render(request, 'pages/404.html', status=404)
 
@@ -2,6 +2,6 @@ import os
 
 from django.core.asgi import get_asgi_application
 
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'blogicum.settings')
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'uralatomprom.settings')
 
 application = get_asgi_application()
@@ -34,6 +34,7 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'core.middleware.SlowRequestMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
@@ -58,6 +59,7 @@ TEMPLATES = [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
+                'core.context_processors.header_user',
             ],
         },
     },
@@ -65,6 +67,9 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'uralatomprom.wsgi.application'
 
+# Асинхронные представления для чтения (запуск под ASGI-сервером).
+ASYNC_VIEWS = os.getenv('ASYNC_VIEWS', 'False') == 'True'
+
 DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.mysql',
@@ -72,9 +77,25 @@ DATABASES = {
         'USER': os.getenv('SQL_USER', 'default'),
         'PASSWORD': os.getenv('SQL_PASSWORD', 'default'),
         'HOST': 'localhost',
+        # Асинхронные страницы выполняют запросы в пуле потоков; постоянные
+        # соединения избавляют от подключения к MySQL на каждый запрос.
+        'CONN_MAX_AGE': int(os.getenv('SQL_CONN_MAX_AGE',
+                                      60 if ASYNC_VIEWS else 0)),
+    }
+}
+
+# Общий для всех процессов кеш (таблица создается командой createcachetable).
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'django_cache',
+        'OPTIONS': {
+            'MAX_ENTRIES': 100_000,
+        },
     }
 }
 
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
@@ -118,8 +139,39 @@ LOGIN_REDIRECT_URL = 'blog:index'
 LOGIN_URL = 'login'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+UPLOAD_SIZE_LIMITS = {
+    'image': 10 * 2 ** 20,
+    'abstract': 20 * 2 ** 20,
+}
+IMAGE_UPLOAD_FIELDS = ('image',)
+MAX_IMAGE_PIXELS = 40_000_000
+IMAGE_WORKERS = 2
+IMAGE_QUEUE_SIZE = 16
+
 CSRF_FAILURE_VIEW = 'pages.views.csrf_failure'
 
 AUTH_USER_MODEL = 'users.Participant'
 
 CAPTCHA_FONT_SIZE = 36
+
+SLOW_REQUEST_THRESHOLD_MS = int(os.getenv('SLOW_REQUEST_THRESHOLD_MS', 500))
+SLOW_REQUEST_SAMPLE_RATE = float(os.getenv('SLOW_REQUEST_SAMPLE_RATE', 1.0))
+SLOW_REQUEST_LOG = BASE_DIR / 'logs' / 'slow_requests.jsonl'
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'slow_requests': {
+            'class': 'core.log.JSONLinesQueueHandler',
+            'filename': str(SLOW_REQUEST_LOG),
+        },
+    },
+    'loggers': {
+        'uralatomprom.slow_requests': {
+            'handlers': ['slow_requests'],
+            'level': 'WARNING',
+            'propagate': False,
+        },
+    },
+}
@@ -4,6 +4,7 @@ from django.urls import path, include
 from django.conf.urls.static import static
 
 from blog.views import ProfileCreateView
+from users.views import RegistrationDashboardView
 
 urlpatterns = [
     path('admin/', admin.site.urls),
@@ -13,6 +14,9 @@ urlpatterns = [
     path('auth/registration/',
          ProfileCreateView.as_view(),
          name='registration',),
+    path('dashboard/',
+         RegistrationDashboardView.as_view(),
+         name='dashboard',),
     path('captcha/', include('captcha.urls')),
 ]
 
@@ -0,0 +1,123 @@
+"""Отрисовка бейджей и сертификатов участников.
+
+Модуль не импортирует Django, чтобы функции можно было выполнять
+в дочерних процессах пула.
+"""
+import hashlib
+import json
+import os
+
+from PIL import Image, ImageDraw, ImageFont
+
+TEMPLATE_VERSION = 1
+CONFERENCE = 'БСАЭ-2024'
+CONFERENCE_TITLE = ('VI всероссийской научно-практической конференции '
+                    '«БСАЭ-2024»')
+CONFERENCE_PLACE = '12-13 марта 2024 г., Екатеринбург'
+ACCENT = (127, 167, 160)
+BLACK = (0, 0, 0)
+GREY = (90, 90, 90)
+# Размеры при 300 dpi: бейдж 90x60 мм, сертификат A4 альбомный.
+SIZES = {
+    'badge': (1063, 709),
+    'certificate': (3508, 2480),
+}
+RESOLUTION = 300
+
+
+def content_hash(kind, full_name, organisation, is_speaker):
+    payload = json.dumps(
+        [TEMPLATE_VERSION, kind, full_name, organisation, bool(is_speaker)],
+        ensure_ascii=False)
+    return hashlib.sha1(payload.encode()).hexdigest()
+
+
+def wrap(text, font, width):
+    lines, line = [], ''
+    for word in text.split():
+        candidate = f'{line} {word}'.strip()
+        if line and font.getlength(candidate) > width:
+            lines.append(line)
+            line = word
+        else:
+            line = candidate
+    return lines + [line] if line else lines
+
+
+def draw_lines(draw, lines, font, top, width, fill, bottom=None):
+    for line in lines:
+        if bottom is not None and top + font.size > bottom:
+            break
+        draw.text((width / 2, top), line, font=font, fill=fill, anchor='ma')
+        top += font.size * 1.25
+    return top
+
+
+def render_badge(image, font_path, full_name, organisation, is_speaker):
+    width, height = image.size
+    draw = ImageDraw.Draw(image)
+    draw.rectangle((0, 0, width, height // 5), fill=ACCENT)
+    title = ImageFont.truetype(font_path, height // 12)
+    draw.text((width / 2, height // 10), CONFERENCE, font=title,
+              fill=BLACK, anchor='mm')
+    name = ImageFont.truetype(font_path, height // 10)
+    name_lines = wrap(full_name, name, width * 0.9)
+    if len(name_lines) > 2:
+        name = ImageFont.truetype(font_path, height // 14)
+        name_lines = wrap(full_name, name, width * 0.9)
+    top = draw_lines(draw, name_lines, name, height // 4, width, BLACK)
+    small = ImageFont.truetype(font_path, height // 16)
+    footer = height * 5 // 6
+    draw_lines(draw, wrap(organisation, small, width * 0.9), small,
+               top + small.size / 2, width, GREY, bottom=footer)
+    draw.rectangle((0, footer, width, height), fill=ACCENT)
+    draw.text((width / 2, height * 11 // 12),
+              'Докладчик' if is_speaker else 'Участник',
+              font=small, fill=BLACK, anchor='mm')
+
+
+def render_certificate(image, font_path, full_name, organisation,
+                       is_speaker):
+    width, height = image.size
+    draw = ImageDraw.Draw(image)
+    margin = width // 30
+    draw.rectangle((margin, margin, width - margin, height - margin),
+                   outline=ACCENT, width=margin // 3)
+    header = ImageFont.truetype(font_path, height // 12)
+    text = ImageFont.truetype(font_path, height // 28)
+    name = ImageFont.truetype(font_path, height // 16)
+    top = draw_lines(draw, ['СЕРТИФИКАТ'], header, height // 6,
+                     width, ACCENT)
+    top = draw_lines(draw, ['Настоящим подтверждается, что'], text,
+                     top + text.size, width, GREY)
+    top = draw_lines(draw, wrap(full_name, name, width * 0.8), name,
+                     top + text.size, width, BLACK)
+    top = draw_lines(draw, wrap(organisation, text, width * 0.8), text,
+                     top, width, GREY)
+    participation = ('принял(а) участие с докладом в работе'
+                     if is_speaker else 'принял(а) участие в работе')
+    top = draw_lines(
+        draw, wrap(f'{participation} {CONFERENCE_TITLE}', text,
+                   width * 0.8),
+        text, top + text.size * 2, width, BLACK)
+    draw_lines(draw, [CONFERENCE_PLACE], text, top + text.size, width,
+               GREY)
+
+
+RENDERERS = {
+    'badge': render_badge,
+    'certificate': render_certificate,
+}
+
+
+def render(job):
+    """Рисует один документ и атомарно записывает его на диск."""
+    path, kind, font_path, full_name, organisation, is_speaker = job
+    image = Image.new('RGB', SIZES[kind], 'white')
+    RENDERERS[kind](image, font_path, full_name or '', organisation or '',
+                    is_speaker)
+    file_format = os.path.splitext(path)[1][1:].upper()
+    temporary = f'{path}.tmp'
+    image.save(temporary, file_format, resolution=RESOLUTION)
+    os.replace(temporary, path)
+    return path
@@ -0,0 +1,215 @@
+import re
+from itertools import combinations
+
+from django.db import transaction
+from django.db.models import Count, Q
+
+from blog.constants import MAX_LENGTH
+from .models import Participant, ParticipantKey
+
+FIELDS = ('full_name', 'email', 'phone', 'organisation')
+MAX_CANDIDATES = 50
+# Ключи, общие для слишком многих участников, не сужают поиск.
+MAX_BLOCK_SIZE = 100
+REPORT_SCORE = 0.5
+BLOCK_SCORE = 0.75
+
+WORD_RE = re.compile(r'\w+')
+ORGANISATION_FORMS = {
+    'ооо', 'оао', 'зао', 'пао', 'ао', 'ип', 'фгуп', 'фгбу', 'фгбун',
+    'фгбоу', 'гбу', 'муп', 'нии', 'во', 'уро', 'ран',
+}
+PHONETIC_GROUPS = {
+    'P': 'бпbp', 'F': 'вфvfw', 'K': 'гкхgkcqh', 'T': 'дтdt',
+    'S': 'зсцzs', 'X': 'жшщчj', 'L': 'лl', 'M': 'мm', 'N': 'нn',
+    'R': 'рr', 'A': 'аеёиоуыэюяaeiouy',
+}
+PHONETIC = {char: code for code, chars in PHONETIC_GROUPS.items()
+            for char in chars}
+
+
+def words(value):
+    return WORD_RE.findall((value or '').lower().replace('ё', 'е'))
+
+
+def phonetic(word):
+    """Грубый фонетический код: глухие и звонкие согласные совпадают,
+    гласные после первой буквы и повторы отбрасываются."""
+    codes = [PHONETIC.get(char, '') for char in word]
+    result = codes[:1]
+    for code in codes[1:]:
+        if code and code != 'A' and code != result[-1]:
+            result.append(code)
+    return ''.join(result)
+
+
+def email_key(email):
+    email = (email or '').strip().lower()
+    if '@' not in email:
+        return None
+    local, domain = email.rsplit('@', 1)
+    local = local.split('+', 1)[0]
+    if domain in ('gmail.com', 'googlemail.com'):
+        local, domain = local.replace('.', ''), 'gmail.com'
+    return f'{local}@{domain}'
+
+
+def phone_key(phone):
+    digits = re.sub(r'\D', '', phone or '')
+    return digits[-10:] if len(digits) >= 7 else None
+
+
+def organisation_key(organisation):
+    return ' '.join(word for word in words(organisation)
+                    if word not in ORGANISATION_FORMS)
+
+
+def trigrams(name):
+    text = f' {" ".join(sorted(name))} '
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+def jaccard(first, second):
+    if not first or not second:
+        return 0.0
+    return len(first & second) / len(first | second)
+
+
+def name_similarity(first, second):
+    """Сходство ФИО по триграммам написания и фонетических кодов."""
+    first, second = words(first), words(second)
+    return max(
+        jaccard(trigrams(first), trigrams(second)),
+        jaccard(trigrams(map(phonetic, first)),
+                trigrams(map(phonetic, second))),
+    )
+
+
+def blocking_keys(values):
+    """Нормализованные ключи, по которым ищутся кандидаты в дубли."""
+    keys = set()
+    email = email_key(values.get('email'))
+    if email:
+        keys.add(f'e:{email}')
+        letters = re.sub(r'[^a-z]', '', email.split('@')[0])
+        if len(letters) >= 4:
+            keys.add(f'l:{letters}')
+    phone = phone_key(values.get('phone'))
+    if phone:
+        keys.add(f'p:{phone}')
+    name = words(values.get('full_name'))
+    if name:
+        codes = [phonetic(word) for word in name]
+        keys.add('n:' + ' '.join(sorted(codes)))
+        organisation = organisation_key(values.get('organisation'))
+        if organisation:
+            keys.add(f'o:{codes[0]}:{organisation}')
+        if len(name) > 1:
+            keys.add(f's:{codes[0]}:{codes[1][:1]}')
+    return {key[:MAX_LENGTH] for key in keys}
+
+
+def surname_code(name):
+    name = words(name)
+    return phonetic(name[0]) if name else None
+
+
+def same_initials(first, second):
+    """Инициалы имени и отчества не противоречат друг другу."""
+    first = [word[0] for word in words(first)[1:]]
+    second = [word[0] for word in words(second)[1:]]
+    common = min(len(first), len(second))
+    return common > 0 and first[:common] == second[:common]
+
+
+def match_score(first, second):
+    def same(field, key):
+        value = key(first.get(field))
+        return bool(value) and value == key(second.get(field))
+
+    score = round(
+        0.4 * name_similarity(first.get('full_name'),
+                              second.get('full_name'))
+        + 0.25 * same('email', email_key)
+        + 0.25 * same('phone', phone_key)
+        + 0.1 * same('organisation', organisation_key),
+        2)
+    # Та же фамилия при общей почте — повторная регистрация, даже если имя
+    # и отчество записаны инициалами. Телефон бывает общим у организации,
+    # поэтому при совпадении только телефона должны совпасть и инициалы.
+    if same('full_name', surname_code) and (
+            same('email', email_key)
+            or same('phone', phone_key) and same_initials(
+                first.get('full_name'), second.get('full_name'))):
+        score = max(score, BLOCK_SCORE)
+    return score
+
+
+def find_duplicates(values, exclude_pk=None):
+    """Похожие участники, отсортированные по убыванию оценки."""
+    # Первыми идут совпадения по почте и телефону, затем по числу ключей,
+    # чтобы частые ключи фамилии не вытеснили точные совпадения.
+    candidates = ParticipantKey.objects.filter(
+        key__in=blocking_keys(values)).exclude(
+            participant_id=exclude_pk).values('participant_id').annotate(
+                contacts=Count('key', filter=Q(key__startswith='e:')
+                               | Q(key__startswith='p:')),
+                keys=Count('key'),
+    ).order_by('-contacts', '-keys', 'participant_id').values_list(
+        'participant_id', flat=True)[:MAX_CANDIDATES]
+    others = Participant.objects.filter(pk__in=list(candidates)).values(
+        'pk', 'username', *FIELDS)
+    return sorted(((match_score(values, other), other) for other in others),
+                  key=lambda match: match[0], reverse=True)
+
+
+def index_participant(participant):
+    values = {field: getattr(participant, field) for field in FIELDS}
+    with transaction.atomic():
+        ParticipantKey.objects.filter(participant=participant).delete()
+        ParticipantKey.objects.bulk_create(
+            ParticipantKey(participant=participant, key=key)
+            for key in blocking_keys(values))
+
+
+def reindex(participants, batch_size=2000):
+    ParticipantKey.objects.all().delete()
+    batch = []
+    for values in participants.values('pk', *FIELDS).iterator(
+            chunk_size=batch_size):
+        batch.extend(ParticipantKey(participant_id=values['pk'], key=key)
+                     for key in blocking_keys(values))
+        if len(batch) >= batch_size:
+            ParticipantKey.objects.bulk_create(batch)
+            batch = []
+    ParticipantKey.objects.bulk_create(batch)
+
+
+def duplicate_report(min_score=REPORT_SCORE):
+    """Пары возможных дублей по всему реестру без перебора всех пар."""
+    pairs = set()
+    block, current = [], None
+    for participant_id, key in ParticipantKey.objects.order_by(
+            'key').values_list('participant_id', 'key').iterator():
+        if key != current:
+            if len(block) <= MAX_BLOCK_SIZE:
+                pairs.update(combinations(sorted(set(block)), 2))
+            block, current = [], key
+        block.append(participant_id)
+    if len(block) <= MAX_BLOCK_SIZE:
+        pairs.update(combinations(sorted(set(block)), 2))
+
+    ids = sorted({pk for pair in pairs for pk in pair})
+    participants = {}
+    for start in range(0, len(ids), MAX_CANDIDATES * 20):
+        participants.update(
+            (values['pk'], values)
+            for values in Participant.objects.filter(
+                pk__in=ids[start:start + MAX_CANDIDATES * 20]).values(
+                    'pk', 'username', *FIELDS))
+    report = []
+    for first, second in pairs:
+        score = match_score(participants[first], participants[second])
+        if score >= min_score:
+            report.append((score, participants[first], participants[second]))
+    return sorted(report, key=lambda match: match[0], reverse=True)
@@ -0,0 +1,28 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+
+from users import duplicates
+
+
+class Command(BaseCommand):
+    help = ('Отчет о возможных повторных регистрациях участников. '
+            'Кандидаты ищутся по нормализованным и фонетическим ключам.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--reindex', action='store_true',
+                            help='Пересчитать ключи всех участников')
+        parser.add_argument('--min-score', type=float,
+                            default=duplicates.REPORT_SCORE)
+
+    def handle(self, *args, **options):
+        if options['reindex']:
+            duplicates.reindex(get_user_model().objects.all())
+        report = duplicates.duplicate_report(options['min_score'])
+        for score, first, second in report:
+            self.stdout.write(
+                f'{score:.2f}\t'
+                f'{first["username"]} ({first["full_name"]}, '
+                f'{first["email"]})\t'
+                f'{second["username"]} ({second["full_name"]}, '
+                f'{second["email"]})')
+        self.stdout.write(f'Найдено пар: {len(report)}')
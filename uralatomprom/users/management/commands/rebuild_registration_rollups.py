@@ -0,0 +1,14 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+
+from users import rollups
+
+
+class Command(BaseCommand):
+    help = ('Пересчитывает сводки регистраций по дням и организациям '
+            'по всей таблице участников.')
+
+    def handle(self, *args, **options):
+        days, organisations = rollups.rebuild(get_user_model().objects.all())
+        self.stdout.write(self.style.SUCCESS(
+            f'Сводки пересчитаны: дней {days}, организаций {organisations}'))
@@ -0,0 +1,117 @@
+import hashlib
+import json
+import os
+import zipfile
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from core.utils import process_pool
+from users.documents import RENDERERS, content_hash, render
+
+DEFAULT_FONT = '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf'
+MANIFEST = 'manifest.json'
+
+
+class Command(BaseCommand):
+    help = ('Генерирует бейджи и сертификаты участников в пуле процессов. '
+            'Неизменившиеся документы пропускаются по хешу содержимого, '
+            'результаты упаковываются в zip-архивы по частям.')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--kind', choices=(*RENDERERS, 'all'),
+                            default='all')
+        parser.add_argument('--format', choices=('pdf', 'png'),
+                            default='pdf', dest='file_format')
+        parser.add_argument('--output',
+                            default=settings.BASE_DIR / 'documents')
+        parser.add_argument('--font', default=DEFAULT_FONT,
+                            help='TrueType-шрифт с кириллицей')
+        parser.add_argument('--workers', type=int, default=os.cpu_count())
+        parser.add_argument('--archive-size', type=int, default=500,
+                            help='Документов в одном архиве')
+
+    def load_manifest(self, path):
+        if not os.path.exists(path):
+            return {'documents': {}, 'archives': {}}
+        with open(path, encoding='utf-8') as file:
+            return json.load(file)
+
+    def save_manifest(self, path, manifest):
+        with open(f'{path}.tmp', 'w', encoding='utf-8') as file:
+            json.dump(manifest, file, ensure_ascii=False, indent=1)
+        os.replace(f'{path}.tmp', path)
+
+    def collect_jobs(self, kinds, manifest, options):
+        """Документы по видам и задания для тех, что изменились."""
+        output = options['output']
+        documents = {kind: [] for kind in kinds}
+        jobs, hashes = [], {}
+        participants = get_user_model().objects.filter(
+            is_active=True).order_by('pk').values_list(
+                'pk', 'full_name', 'organisation', 'is_speaker')
+        for pk, full_name, organisation, is_speaker in participants.iterator():
+            for kind in kinds:
+                name = f'{kind}-{pk}.{options["file_format"]}'
+                path = os.path.join(output, name)
+                digest = content_hash(kind, full_name, organisation,
+                                      is_speaker)
+                documents[kind].append((name, digest))
+                if (manifest['documents'].get(name) != digest
+                        or not os.path.exists(path)):
+                    jobs.append((path, kind, options['font'], full_name,
+                                 organisation, is_speaker))
+                    hashes[path] = (name, digest)
+        return documents, jobs, hashes
+
+    def render_jobs(self, jobs, hashes, manifest, workers):
+        with process_pool(workers) as pool:
+            for path in pool.imap_unordered(render, jobs, chunksize=8):
+                name, digest = hashes[path]
+                manifest['documents'][name] = digest
+
+    def pack_archives(self, documents, manifest, output, size):
+        archived = 0
+        for kind, entries in documents.items():
+            for start in range(0, len(entries), size):
+                chunk = entries[start:start + size]
+                name = f'{kind}-{start // size + 1:04d}.zip'
+                digest = hashlib.sha1(
+                    json.dumps(chunk).encode()
+                ).hexdigest()
+                path = os.path.join(output, name)
+                if (manifest['archives'].get(name) == digest
+                        and os.path.exists(path)):
+                    continue
+                with zipfile.ZipFile(f'{path}.tmp', 'w',
+                                     zipfile.ZIP_STORED) as archive:
+                    for document, _ in chunk:
+                        archive.write(os.path.join(output, document),
+                                      document)
+                os.replace(f'{path}.tmp', path)
+                manifest['archives'][name] = digest
+                archived += 1
+        return archived
+
+    def handle(self, *args, **options):
+        if not os.path.exists(options['font']):
+            raise CommandError(f'Шрифт не найден: {options["font"]}')
+        output = options['output']
+        os.makedirs(output, exist_ok=True)
+        manifest_path = os.path.join(output, MANIFEST)
+        manifest = self.load_manifest(manifest_path)
+        kinds = (RENDERERS if options['kind'] == 'all'
+                 else (options['kind'],))
+
+        documents, jobs, hashes = self.collect_jobs(kinds, manifest, options)
+        self.render_jobs(jobs, hashes, manifest, options['workers'])
+        total = sum(map(len, documents.values()))
+        self.stdout.write(f'Отрисовано документов: {len(jobs)}, '
+                          f'без изменений: {total - len(jobs)}')
+
+        archived = self.pack_archives(documents, manifest, output,
+                                      options['archive_size'])
+        self.save_manifest(manifest_path, manifest)
+        self.stdout.write(self.style.SUCCESS(
+            f'Обновлено архивов: {archived}'))
@@ -0,0 +1,41 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OrganisationStat',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('organisation', models.CharField(max_length=256, unique=True, verbose_name='Организация')),
+                ('participants', models.IntegerField(default=0, verbose_name='Участники')),
+                ('speakers', models.IntegerField(default=0, verbose_name='С докладом')),
+                ('abstracts', models.IntegerField(default=0, verbose_name='Загружены тезисы')),
+            ],
+            options={
+                'verbose_name': 'регистрации организации',
+                'verbose_name_plural': 'Регистрации по организациям',
+                'ordering': ('-participants',),
+            },
+        ),
+        migrations.CreateModel(
+            name='RegistrationDay',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(unique=True, verbose_name='День')),
+                ('participants', models.IntegerField(default=0, verbose_name='Участники')),
+                ('speakers', models.IntegerField(default=0, verbose_name='С докладом')),
+                ('abstracts', models.IntegerField(default=0, verbose_name='Загружены тезисы')),
+            ],
+            options={
+                'verbose_name': 'регистрации за день',
+                'verbose_name_plural': 'Регистрации по дням',
+                'ordering': ('day',),
+            },
+        ),
+    ]
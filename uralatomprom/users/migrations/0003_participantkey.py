@@ -0,0 +1,25 @@
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0002_registration_rollups'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ParticipantKey',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(db_index=True, max_length=256, verbose_name='Ключ')),
+                ('participant', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='duplicate_keys', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'ключ поиска дублей',
+                'verbose_name_plural': 'Ключи поиска дублей',
+            },
+        ),
+    ]
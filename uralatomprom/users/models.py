@@ -48,3 +48,55 @@ class Participant(AbstractUser):
 
     def __str__(self):
         return self.username
+
+
+class RegistrationDay(models.Model):
+    day = models.DateField('День', unique=True)
+    participants = models.IntegerField('Участники', default=0)
+    speakers = models.IntegerField('С докладом', default=0)
+    abstracts = models.IntegerField('Загружены тезисы', default=0)
+
+    class Meta:
+        verbose_name = 'регистрации за день'
+        verbose_name_plural = 'Регистрации по дням'
+        ordering = ('day',)
+
+    def __str__(self):
+        return str(self.day)
+
+    @property
+    def listeners(self):
+        return self.participants - self.speakers
+
+
+class OrganisationStat(models.Model):
+    organisation = models.CharField('Организация',
+                                    max_length=MAX_LENGTH,
+                                    unique=True)
+    participants = models.IntegerField('Участники', default=0)
+    speakers = models.IntegerField('С докладом', default=0)
+    abstracts = models.IntegerField('Загружены тезисы', default=0)
+
+    class Meta:
+        verbose_name = 'регистрации организации'
+        verbose_name_plural = 'Регистрации по организациям'
+        ordering = ('-participants',)
+
+    def __str__(self):
+        return self.organisation
+
+
+class ParticipantKey(models.Model):
+    participant = models.ForeignKey(
+        Participant,
+        on_delete=models.CASCADE,
+        related_name='duplicate_keys',
+    )
+    key = models.CharField('Ключ', max_length=MAX_LENGTH, db_index=True)
+
+    class Meta:
+        verbose_name = 'ключ поиска дублей'
+        verbose_name_plural = 'Ключи поиска дублей'
+
+    def __str__(self):
+        return self.key
@@ -0,0 +1,72 @@
+from collections import Counter
+
+from django.db import transaction
+from django.db.models import F
+from django.utils.timezone import localdate
+
+from .models import OrganisationStat, RegistrationDay
+
+TRACKED_FIELDS = ('date_joined', 'organisation', 'is_speaker', 'abstract')
+NO_ORGANISATION = 'Не указана'
+COUNTERS = ('participants', 'speakers', 'abstracts')
+
+
+def normalise_organisation(organisation):
+    return ' '.join((organisation or '').split()) or NO_ORGANISATION
+
+
+def contribution(date_joined, organisation, is_speaker, abstract):
+    """Вклад одного участника в сводки: ключи строк и счетчики."""
+    return (localdate(date_joined),
+            normalise_organisation(organisation),
+            (1, int(bool(is_speaker)), int(bool(abstract))))
+
+
+def _add(model, lookup, defaults, counts, sign):
+    model.objects.get_or_create(**lookup, defaults=defaults)
+    model.objects.filter(**lookup).update(**{
+        field: F(field) + sign * value
+        for field, value in zip(COUNTERS, counts) if value})
+
+
+def apply(values, sign):
+    day, organisation, counts = contribution(
+        *(values[field] for field in TRACKED_FIELDS))
+    _add(RegistrationDay, {'day': day}, {}, counts, sign)
+    _add(OrganisationStat, {'organisation__iexact': organisation},
+         {'organisation': organisation}, counts, sign)
+
+
+def update(old_values, new_values):
+    """Переносит вклад участника из старого состояния в новое."""
+    if old_values is not None and new_values is not None and (
+            contribution(*(old_values[f] for f in TRACKED_FIELDS))
+            == contribution(*(new_values[f] for f in TRACKED_FIELDS))):
+        return
+    with transaction.atomic():
+        if old_values is not None:
+            apply(old_values, -1)
+        if new_values is not None:
+            apply(new_values, 1)
+
+
+def rebuild(participants):
+    days, organisations = {}, {}
+    display = {}
+    for values in participants.values_list(*TRACKED_FIELDS).iterator():
+        day, organisation, counts = contribution(*values)
+        key = organisation.casefold()
+        display.setdefault(key, organisation)
+        days.setdefault(day, Counter()).update(dict(zip(COUNTERS, counts)))
+        organisations.setdefault(key, Counter()).update(
+            dict(zip(COUNTERS, counts)))
+    with transaction.atomic():
+        RegistrationDay.objects.all().delete()
+        OrganisationStat.objects.all().delete()
+        RegistrationDay.objects.bulk_create(
+            RegistrationDay(day=day, **counts)
+            for day, counts in days.items())
+        OrganisationStat.objects.bulk_create(
+            OrganisationStat(organisation=display[key], **counts)
+            for key, counts in organisations.items())
+    return len(days), len(organisations)
@@ -0,0 +1,41 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from . import duplicates, rollups
+from .models import Participant
+
+
+def tracked(update_fields):
+    return update_fields is None or not set(update_fields).isdisjoint(
+        rollups.TRACKED_FIELDS)
+
+
+@receiver(pre_save, sender=Participant)
+def remember_rollup_state(sender, instance, update_fields=None, **kwargs):
+    instance._rollup_state = None
+    if instance.pk and tracked(update_fields):
+        instance._rollup_state = sender.objects.filter(
+            pk=instance.pk).values(*rollups.TRACKED_FIELDS).first()
+
+
+@receiver(post_save, sender=Participant)
+def update_rollups(sender, instance, update_fields=None, **kwargs):
+    if not tracked(update_fields):
+        return
+    rollups.update(
+        instance._rollup_state,
+        {field: getattr(instance, field) for field in rollups.TRACKED_FIELDS})
+
+
+@receiver(post_delete, sender=Participant)
+def remove_from_rollups(sender, instance, **kwargs):
+    rollups.update(
+        {field: getattr(instance, field) for field in rollups.TRACKED_FIELDS},
+        None)
+
+
+@receiver(post_save, sender=Participant)
+def update_duplicate_keys(sender, instance, update_fields=None, **kwargs):
+    if update_fields is None or not set(update_fields).isdisjoint(
+            duplicates.FIELDS):
+        duplicates.index_participant(instance)
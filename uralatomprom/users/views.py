@@ -0,0 +1,28 @@
+from django.contrib.auth.mixins import LoginRequiredMixin
+from django.views.generic import TemplateView
+
+from blog.mixins import UserInStaffMixin
+from .models import OrganisationStat, RegistrationDay
+from .rollups import COUNTERS
+
+TOP_ORGANISATIONS = 20
+
+
+class RegistrationDashboardView(LoginRequiredMixin, UserInStaffMixin,
+                                TemplateView):
+    template_name = 'users/dashboard.html'
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        days = list(RegistrationDay.objects.all())
+        totals = {field: sum(getattr(day, field) for day in days)
+                  for field in COUNTERS}
+        totals['listeners'] = totals['participants'] - totals['speakers']
+        totals['max_day'] = max(
+            (day.participants for day in days), default=0)
+        organisations = OrganisationStat.objects.filter(participants__gt=0)
+        context['totals'] = totals
+        context['days'] = days
+        context['organisations'] = organisations[:TOP_ORGANISATIONS]
+        context['organisations_count'] = organisations.count()
+        return context